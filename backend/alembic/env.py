@@ -15,6 +15,12 @@ from app.models.user import User
 from app.models.interview import Interview
 from app.models.job import Job
 from app.models.two_factor import TwoFactorCode, TwoFactorSession
+from app.models.interview_session import InterviewSessionState
+from app.models.cv_cache import CVExtractionCache
+from app.models.cv_ingestion_job import CVIngestionJob
+from app.models.cv_import import CVImportRun, CVImportFile
+from app.models.interview_message import InterviewMessage
+from app.models.interview_answer_score import InterviewAnswerScore
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
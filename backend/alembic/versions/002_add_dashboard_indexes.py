@@ -0,0 +1,65 @@
+"""Add composite indexes for dashboard and 2FA access patterns
+
+Revision ID: 002_add_dashboard_indexes
+Revises: 001_add_2fa_columns
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002_add_dashboard_indexes'
+down_revision: Union[str, None] = '001_add_2fa_columns'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables created by create_all already have these indexes, so skip existing ones
+
+    # Recruiter dashboard, newest first (optionally filtered by status)
+    op.create_index(
+        'ix_interviews_created_at_id', 'interviews',
+        [sa.text('created_at DESC'), sa.text('id DESC')],
+        if_not_exists=True
+    )
+    op.create_index(
+        'ix_interviews_status_created_at_id', 'interviews',
+        ['status', sa.text('created_at DESC'), sa.text('id DESC')],
+        if_not_exists=True
+    )
+
+    # A candidate's own interviews, newest first
+    op.create_index(
+        'ix_interviews_user_created_at_id', 'interviews',
+        ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        if_not_exists=True
+    )
+
+    # Scored candidates, best first; only completed interviews carry a score
+    op.create_index(
+        'ix_interviews_completed_score_id', 'interviews',
+        [sa.text('score DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text("status = 'completed'"),
+        sqlite_where=sa.text("status = 'completed'"),
+        if_not_exists=True
+    )
+
+    # 2FA session cleanup and expiry checks by user
+    op.create_index(
+        'ix_two_factor_sessions_user_id_expires_at', 'two_factor_sessions',
+        ['user_id', 'expires_at'],
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_two_factor_sessions_user_id_expires_at', table_name='two_factor_sessions', if_exists=True)
+    op.drop_index('ix_interviews_completed_score_id', table_name='interviews', if_exists=True)
+    op.drop_index('ix_interviews_user_created_at_id', table_name='interviews', if_exists=True)
+    op.drop_index('ix_interviews_status_created_at_id', table_name='interviews', if_exists=True)
+    op.drop_index('ix_interviews_created_at_id', table_name='interviews', if_exists=True)
@@ -0,0 +1,97 @@
+"""Convert JSON text columns to JSONB with GIN indexes
+
+Revision ID: 003_json_columns_to_jsonb
+Revises: 002_add_dashboard_indexes
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003_json_columns_to_jsonb'
+down_revision: Union[str, None] = '002_add_dashboard_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, USING expression)
+JSON_COLUMNS = [
+    ('jobs', 'required_skills', "required_skills::jsonb"),
+    ('jobs', 'preferred_skills', "NULLIF(preferred_skills, '')::jsonb"),
+    ('interviews', 'conversation', "NULLIF(conversation, '')::jsonb"),
+    ('interviews', 'assessment', "NULLIF(assessment, '')::jsonb"),
+    # users.info was free text editable through the profile API
+    ('users', 'info', "_info_to_jsonb(info)"),
+]
+
+GIN_INDEXES = [
+    ('ix_jobs_required_skills_gin', 'jobs', 'required_skills'),
+    ('ix_interviews_assessment_gin', 'interviews', 'assessment'),
+    ('ix_users_info_gin', 'users', 'info'),
+]
+
+
+def _is_jsonb(table: str, column: str) -> bool:
+    if op.get_context().as_sql:
+        # Offline (--sql) mode cannot inspect; emit every conversion
+        return False
+    columns = sa.inspect(op.get_bind()).get_columns(table)
+    return any(c['name'] == column and isinstance(c['type'], postgresql.JSONB) for c in columns)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        # Other backends store the JSON type as text already
+        return
+
+    # Keep non-JSON or non-object profile info instead of failing the cast
+    op.execute("""
+        CREATE OR REPLACE FUNCTION _info_to_jsonb(value text) RETURNS jsonb AS $$
+        DECLARE
+            parsed jsonb;
+        BEGIN
+            IF value IS NULL OR btrim(value) = '' THEN
+                RETURN NULL;
+            END IF;
+            parsed := value::jsonb;
+            IF jsonb_typeof(parsed) = 'object' THEN
+                RETURN parsed;
+            END IF;
+            RETURN jsonb_build_object('text', value);
+        EXCEPTION WHEN others THEN
+            RETURN jsonb_build_object('text', value);
+        END;
+        $$ LANGUAGE plpgsql IMMUTABLE
+    """)
+
+    for table, column, using in JSON_COLUMNS:
+        # Tables created by create_all after this change are already JSONB
+        if _is_jsonb(table, column):
+            continue
+        op.alter_column(table, column, type_=postgresql.JSONB(), postgresql_using=using)
+
+    op.execute("DROP FUNCTION _info_to_jsonb(text)")
+
+    for name, table, column in GIN_INDEXES:
+        op.create_index(
+            name, table, [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'},
+            if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for name, table, _ in GIN_INDEXES:
+        op.drop_index(name, table_name=table, if_exists=True)
+
+    for table, column, _ in JSON_COLUMNS:
+        op.alter_column(table, column, type_=sa.Text(), postgresql_using=f"{column}::text")
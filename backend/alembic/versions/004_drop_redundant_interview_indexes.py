@@ -0,0 +1,30 @@
+"""Drop single-column interview indexes covered by the composite ones
+
+Revision ID: 004_drop_redundant_interview_indexes
+Revises: 003_json_columns_to_jsonb
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004_drop_redundant_interview_indexes'
+down_revision: Union[str, None] = '003_json_columns_to_jsonb'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ix_interviews_user_created_at_id leads with user_id
+    op.drop_index('ix_interviews_user_id', table_name='interviews', if_exists=True)
+    # Score is only sorted for completed interviews, via ix_interviews_completed_score_id,
+    # and planners picked this full index over the partial one
+    op.drop_index('ix_interviews_score', table_name='interviews', if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index('ix_interviews_score', 'interviews', ['score'], if_not_exists=True)
+    op.create_index('ix_interviews_user_id', 'interviews', ['user_id'], if_not_exists=True)
@@ -0,0 +1,68 @@
+"""Make legacy JSON text columns readable on SQLite
+
+Revision ID: 005_wrap_free_text_json_on_sqlite
+Revises: 004_drop_redundant_interview_indexes
+Create Date: 2026-10-18
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005_wrap_free_text_json_on_sqlite'
+down_revision: Union[str, None] = '004_drop_redundant_interview_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns read through the JSON type; empty strings were stored for "no value"
+JSON_COLUMNS = [
+    ('jobs', 'required_skills'),
+    ('jobs', 'preferred_skills'),
+    ('interviews', 'conversation'),
+    ('interviews', 'assessment'),
+    ('users', 'info'),
+]
+
+
+def _info_to_json(value) -> str:
+    """Same rule as 003 applies on PostgreSQL: keep JSON objects, wrap anything else"""
+    if not isinstance(value, str):
+        # Numeric-looking text can come back as a number from a JSON-typed column
+        return json.dumps({"text": str(value)})
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        parsed = None
+    if isinstance(parsed, dict):
+        return value
+    return json.dumps({"text": value})
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'sqlite':
+        # PostgreSQL converted these columns in 003
+        return
+
+    for table, column in JSON_COLUMNS:
+        op.execute(f"UPDATE {table} SET {column} = NULL WHERE trim({column}) = ''")
+
+    # users.info was free text editable through the profile API
+    conn = op.get_bind()
+    rows = conn.execute(sa.text("SELECT id, info FROM users WHERE info IS NOT NULL")).fetchall()
+    for user_id, info in rows:
+        converted = _info_to_json(info)
+        if converted != info:
+            conn.execute(
+                sa.text("UPDATE users SET info = :info WHERE id = :id"),
+                {"info": converted, "id": user_id}
+            )
+
+
+def downgrade() -> None:
+    # Wrapped values stay readable as plain text under the "text" key
+    pass
@@ -0,0 +1,43 @@
+"""Add an expression index for cultural_fit range filters
+
+Revision ID: 006_add_cultural_fit_index
+Revises: 005_wrap_free_text_json_on_sqlite
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006_add_cultural_fit_index'
+down_revision: Union[str, None] = '005_wrap_free_text_json_on_sqlite'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    # The index casts to float, so scores the model returned as text are
+    # cleared first instead of failing the build
+    op.execute("""
+        UPDATE interviews
+        SET assessment = jsonb_set(assessment, '{cultural_fit}', 'null'::jsonb)
+        WHERE jsonb_typeof(assessment -> 'cultural_fit') NOT IN ('number', 'null')
+    """)
+
+    # Must match Interview.assessment["cultural_fit"].as_float() as SQLAlchemy renders it
+    op.execute("""
+        CREATE INDEX IF NOT EXISTS ix_interviews_cultural_fit
+        ON interviews ((CAST(assessment ->> 'cultural_fit' AS FLOAT)))
+    """)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_interviews_cultural_fit', table_name='interviews', if_exists=True)
@@ -0,0 +1,27 @@
+"""Add a heartbeat column for background assessments
+
+Revision ID: 007_add_assessment_heartbeat
+Revises: 006_add_cultural_fit_index
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007_add_assessment_heartbeat'
+down_revision: Union[str, None] = '006_add_cultural_fit_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NULL means unclaimed: interviews already "assessing" are resumed by the next sweep
+    op.add_column('interviews', sa.Column('assessment_heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('interviews', 'assessment_heartbeat_at')
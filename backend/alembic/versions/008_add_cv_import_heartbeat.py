@@ -0,0 +1,37 @@
+"""Add a heartbeat column for bulk CV import runs
+
+Revision ID: 008_add_cv_import_heartbeat
+Revises: 007_add_assessment_heartbeat
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008_add_cv_import_heartbeat'
+down_revision: Union[str, None] = '007_add_assessment_heartbeat'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_heartbeat_column() -> Union[bool, None]:
+    """None when cv_import_runs does not exist yet (the application creates it on startup)"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('cv_import_runs'):
+        return None
+    return any(column['name'] == 'heartbeat_at' for column in inspector.get_columns('cv_import_runs'))
+
+
+def upgrade() -> None:
+    # NULL falls back to started_at: runs left "running" are failed by the next sweep
+    if _has_heartbeat_column() is False:
+        op.add_column('cv_import_runs', sa.Column('heartbeat_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    if _has_heartbeat_column():
+        op.drop_column('cv_import_runs', 'heartbeat_at')
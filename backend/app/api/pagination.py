@@ -0,0 +1,113 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Type
+
+from fastapi import HTTPException, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import DateTime, func, literal, tuple_
+from sqlalchemy.orm import Query
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+# Response header carrying the cursor for the next page; absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# SQLite keeps DateTime as text, with or without fractional seconds depending on
+# whether CURRENT_TIMESTAMP or the driver wrote it, so values are compared in one format
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%f"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque token for the sort key of the last row on a page"""
+    raw = json.dumps(jsonable_encoder(list(values)), separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _cursor_value(column, value: Any) -> Any:
+    """Convert one decoded cursor value for `column`, rejecting values of the wrong type"""
+    if value is None:
+        return None
+    if isinstance(column.type, DateTime):
+        return datetime.fromisoformat(value)
+    expected = column.type.python_type
+    numeric = expected in (int, float) and isinstance(value, (int, float)) and not isinstance(value, bool)
+    if not (numeric or isinstance(value, expected)):
+        raise TypeError(f"cursor value for {column.key} has the wrong type")
+    return value
+
+
+def decode_cursor(cursor: str, columns: Sequence) -> List[Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor does not match this listing")
+        return [_cursor_value(column, value) for column, value in zip(columns, values)]
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _sort_keys(query: Query, columns: Sequence, values: Sequence[Any]):
+    """Column and cursor expressions to compare, normalizing SQLite datetimes"""
+    if query.session.get_bind().dialect.name != "sqlite":
+        return list(columns), list(values)
+
+    keys, bounds = [], []
+    for column, value in zip(columns, values):
+        if isinstance(column.type, DateTime):
+            keys.append(func.strftime(SQLITE_DATETIME_FORMAT, column))
+            bounds.append(func.strftime(SQLITE_DATETIME_FORMAT, literal(value, column.type)))
+        else:
+            keys.append(column)
+            bounds.append(value)
+    return keys, bounds
+
+
+def keyset_page(query: Query, columns: Sequence, cursor: Optional[str], limit: int):
+    """Fetch one page ordered by `columns` descending, starting after `cursor`.
+
+    The last column must be unique (the primary key) so ties on the leading
+    columns are resolved deterministically. Returns (rows, next_cursor).
+    """
+    values = decode_cursor(cursor, columns) if cursor else [None] * len(columns)
+    keys, bounds = _sort_keys(query, columns, values)
+    if cursor:
+        query = query.filter(tuple_(*keys) < tuple_(*bounds))
+    rows = query.order_by(*[key.desc() for key in keys]).limit(limit + 1).all()
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor([getattr(last, column.key) for column in columns])
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[set]:
+    """Validate a comma-separated `fields=` selection against a response model"""
+    if not fields:
+        return None
+    selected = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = selected - set(model.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    # Always keep the id so clients can key rows and request details
+    return selected | {"id"}
+
+
+def page_response(items: List[BaseModel], next_cursor: Optional[str], fields: Optional[set] = None) -> JSONResponse:
+    """JSON list of items, trimmed to `fields`, with the next cursor in a header"""
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None
+    return JSONResponse(
+        content=jsonable_encoder([item.model_dump(include=fields) for item in items]),
+        headers=headers
+    )
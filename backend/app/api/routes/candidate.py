@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, UploadFile, File
+from sqlalchemy.orm import Session, load_only
+from typing import List, Optional
 import json
 
+from ...core.config import settings
 from ...core.database import get_db
 from ...core.security import get_current_user
 from ...models.user import User, Role
 from ...models.interview import Interview
 from ...schemas.user import UserResponse, UserUpdate, UserProfileResponse
 from ...schemas.interview import InterviewCreate, InterviewResponse
+from ...services.recruiter_stats import invalidate_recruiter_stats
+from ...services.interview_preparation import prepare_opening
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, page_response, parse_fields
 
 router = APIRouter(prefix="/candidate", tags=["Candidate"])
 
@@ -70,6 +74,9 @@ def update_cv(
 
 @router.get("/interviews", response_model=List[InterviewResponse])
 def get_my_interviews(
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -79,16 +86,24 @@ def get_my_interviews(
             detail="Only candidates can access this endpoint"
         )
 
-    interviews = db.query(Interview).filter(
-        Interview.user_id == current_user.id
-    ).order_by(Interview.created_at.desc()).all()
+    selected = parse_fields(fields, InterviewResponse)
+    interviews, next_cursor = keyset_page(
+        db.query(Interview).options(load_only(
+            Interview.id, Interview.user_id, Interview.position, Interview.company,
+            Interview.score, Interview.status, Interview.created_at, Interview.completed_at
+        )).filter(Interview.user_id == current_user.id),
+        (Interview.created_at, Interview.id),
+        cursor,
+        limit
+    )
 
-    return interviews
+    return page_response([InterviewResponse.model_validate(i) for i in interviews], next_cursor, selected)
 
 
 @router.post("/interviews", response_model=InterviewResponse)
 def create_interview(
     interview_data: InterviewCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -107,6 +122,11 @@ def create_interview(
     db.add(new_interview)
     db.commit()
     db.refresh(new_interview)
+    invalidate_recruiter_stats()
+
+    # Generate the opening question now so starting the interview is instant
+    if settings.INTERVIEW_PREPARE_OPENING:
+        background_tasks.add_task(prepare_opening, new_interview.id)
 
     return new_interview
 
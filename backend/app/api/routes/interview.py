@@ -1,14 +1,19 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
-from sqlalchemy.orm import Session
-from typing import Optional
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse, JSONResponse
+from sqlalchemy.orm import Session, undefer_group
+from openai import RateLimitError
+from typing import Optional, AsyncIterator
+import asyncio
 import json
+import os
 
-from ...core.database import get_db
+from ...core.config import settings
+from ...core.database import get_db, SessionLocal
 from ...core.security import get_current_user
 from ...models.user import User, Role
 from ...models.interview import Interview
 from ...models.job import Job
+from ...models.cv_ingestion_job import CVIngestionJob
 from ...schemas.interview import (
     InterviewCreate,
     InterviewResponse,
@@ -17,28 +22,47 @@ from ...schemas.interview import (
     InterviewMessageResponse
 )
 from ...services.ai_service import (
-    get_ai_service,
+    InterviewSimulator,
     get_interview_session,
-    remove_interview_session
+    save_interview_session,
+    schedule_context_summary
 )
+from ...services.cv_parser import CVParseTimeoutError, CVTooLargeError, spool_upload
+from ...services.cv_ingestion import (
+    CVIngestionQueue,
+    IngestionQueueFullError,
+    apply_cv_to_user,
+    get_ingestion_queue,
+    process_cv_file,
+    profile_summary
+)
+from ...services.recruiter_stats import invalidate_recruiter_stats
+from ...services.interview_transcript import (
+    iter_transcript,
+    load_conversation,
+    opening_message,
+    record_opening,
+    record_turn,
+    transcript_length
+)
+from ...services.interview_preparation import initialize_for_interview
+from ...services.interview_assessment import begin_assessment, retry_assessment
+from ...services.answer_scoring import schedule_answer_scoring
 
 router = APIRouter(prefix="/interview", tags=["Interview"])
 
+# The conversation is over; results are pending, unavailable or ready
+FINISHED_STATUSES = ("assessing", "assessment_failed", "completed")
 
-@router.post("/start/{interview_id}")
-def start_interview(
-    interview_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
-):
-    """Start an AI interview session"""
+
+def _get_active_interview(interview_id: int, current_user: User, db: Session) -> Interview:
+    """Load an interview the current candidate can still send messages to"""
     if current_user.role != Role.CANDIDATE.value:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only candidates can take interviews"
+            detail="Only candidates can participate in interviews"
         )
 
-    # Get interview
     interview = db.query(Interview).filter(
         Interview.id == interview_id,
         Interview.user_id == current_user.id
@@ -50,47 +74,97 @@ def start_interview(
             detail="Interview not found"
         )
 
-    if interview.status == "completed":
+    if interview.status in FINISHED_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="This interview has already been completed"
         )
 
-    # Initialize interview session
-    session = get_interview_session(interview_id)
-    session.initialize(
-        candidate_cv=current_user.cv or f"Candidate: {current_user.name}\nEmail: {current_user.email}",
-        job_position=interview.position,
-        job_description=f"Interview for {interview.position} position at {interview.company or 'our company'}"
-    )
+    return interview
 
-    # Update interview status
-    interview.status = "in_progress"
-    db.commit()
 
-    # Get first interviewer message
-    result = session.get_next_message()
+def _get_finished_interview(interview_id: int, current_user: User, db: Session, *options) -> Interview:
+    """Load a finished interview; candidates can only see their own, recruiters can see all"""
+    query = db.query(Interview).options(*options)
+    if current_user.role == Role.CANDIDATE.value:
+        query = query.filter(Interview.user_id == current_user.id)
+    interview = query.filter(Interview.id == interview_id).first()
 
-    return {
-        "interview_id": interview_id,
-        "status": "in_progress",
-        "interviewer_message": result["message"],
-        "is_complete": result["is_complete"]
-    }
+    if not interview:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Interview not found"
+        )
 
+    if interview.status not in FINISHED_STATUSES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Interview has not been completed yet"
+        )
 
-@router.post("/message/{interview_id}", response_model=InterviewMessageResponse)
-def send_message(
+    return interview
+
+
+def _load_session(interview: Interview, user: User, db: Session) -> InterviewSimulator:
+    """Get the live session, rehydrating it from persisted turns when needed.
+
+    A session is rebuilt when it was evicted, lost in a worker restart, or is
+    behind the transcript because another worker served the last turn. This
+    reads the session store and the transcript, so call it with
+    asyncio.to_thread from async code.
+    """
+    session = get_interview_session(interview.id)
+    persisted = transcript_length(db, interview.id)
+    # Sessions started before turns were persisted have no transcript to check against
+    if session.is_initialized and persisted in (0, len(session.get_conversation_history())):
+        return session
+
+    # A pending interview has no live session yet; loading its prepared opening is not a recovery
+    if persisted and (session.is_initialized or interview.status != "pending"):
+        print(f"[INTERVIEW] Rehydrating session {interview.id} from {persisted} persisted turn(s)")
+    session = InterviewSimulator()
+    initialize_for_interview(session, interview, user)
+    session.restore_turns(iter_transcript(db, interview.id))
+    return session
+
+
+async def _persist_streamed_turn(
+    interview_id: int,
+    session: InterviewSimulator,
+    candidate_message: str,
+    result: dict
+):
+    """Record a turn from a streaming transport with its own database session"""
+    db = SessionLocal()
+    try:
+        answer_seq = await asyncio.to_thread(record_turn, db, interview_id, candidate_message, result)
+        if result["is_complete"]:
+            interview = db.query(Interview).filter(Interview.id == interview_id).first()
+            begin_assessment(db, interview, session)
+        else:
+            await asyncio.to_thread(save_interview_session, interview_id, session)
+            schedule_context_summary(interview_id, session)
+            schedule_answer_scoring(interview_id, answer_seq)
+    finally:
+        db.close()
+
+
+def _sse(data: dict, event: Optional[str] = None) -> str:
+    frame = f"event: {event}\n" if event else ""
+    return frame + f"data: {json.dumps(data)}\n\n"
+
+
+@router.post("/start/{interview_id}")
+async def start_interview(
     interview_id: int,
-    message: InterviewMessageRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Send a message in the interview and get AI response"""
+    """Start an AI interview session"""
     if current_user.role != Role.CANDIDATE.value:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only candidates can participate in interviews"
+            detail="Only candidates can take interviews"
         )
 
     # Get interview
@@ -105,30 +179,71 @@ def send_message(
             detail="Interview not found"
         )
 
-    if interview.status == "completed":
+    if interview.status in FINISHED_STATUSES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="This interview has already been completed"
         )
 
+    # Serve the opening prepared when the interview was created, if it is ready
+    prepared = opening_message(db, interview_id) if interview.status == "pending" else None
+    if prepared is not None:
+        session = await asyncio.to_thread(_load_session, interview, current_user, db)
+        interview.status = "in_progress"
+        db.commit()
+        invalidate_recruiter_stats()
+        await asyncio.to_thread(save_interview_session, interview_id, session)
+        return {
+            "interview_id": interview_id,
+            "status": "in_progress",
+            "interviewer_message": prepared,
+            "is_complete": False
+        }
+
+    # Initialize interview session
+    session = await asyncio.to_thread(get_interview_session, interview_id)
+    initialize_for_interview(session, interview, current_user)
+
+    # Update interview status
+    interview.status = "in_progress"
+    db.commit()
+    invalidate_recruiter_stats()
+
+    # Get first interviewer message; starting over discards any earlier transcript
+    result = await session.get_next_message_async()
+    await asyncio.to_thread(record_opening, db, interview_id, result)
+    await asyncio.to_thread(save_interview_session, interview_id, session)
+
+    return {
+        "interview_id": interview_id,
+        "status": "in_progress",
+        "interviewer_message": result["message"],
+        "is_complete": result["is_complete"]
+    }
+
+
+@router.post("/message/{interview_id}", response_model=InterviewMessageResponse)
+async def send_message(
+    interview_id: int,
+    message: InterviewMessageRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Send a message in the interview and get AI response"""
+    interview = _get_active_interview(interview_id, current_user, db)
+
     # Get session and process message
-    session = get_interview_session(interview_id)
-    result = session.get_next_message(message.message)
+    session = await asyncio.to_thread(_load_session, interview, current_user, db)
+    result = await session.get_next_message_async(message.message)
+    answer_seq = await asyncio.to_thread(record_turn, db, interview_id, message.message, result)
 
-    # If interview is complete, generate assessment and save
+    # If interview is complete, score it in the background and return the closing message
     if result["is_complete"]:
-        assessment = session.generate_assessment()
-        conversation = session.get_conversation_history()
-
-        interview.status = "completed"
-        interview.score = assessment.get("overall_score", 0)
-        interview.conversation = json.dumps(conversation)
-        interview.assessment = json.dumps(assessment)
-        interview.completed_at = datetime.utcnow()
-        db.commit()
-
-        # Clean up session
-        remove_interview_session(interview_id)
+        begin_assessment(db, interview, session)
+    else:
+        await asyncio.to_thread(save_interview_session, interview_id, session)
+        schedule_context_summary(interview_id, session)
+        schedule_answer_scoring(interview_id, answer_seq)
 
     return InterviewMessageResponse(
         interviewer_message=result["message"],
@@ -136,6 +251,148 @@ def send_message(
     )
 
 
+@router.post("/message/{interview_id}/stream")
+async def stream_message(
+    interview_id: int,
+    message: InterviewMessageRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Send a message and stream the interviewer reply as Server-Sent Events.
+
+    Emits one unnamed event per token ({"token": ...}) followed by a "done"
+    event with the same body as POST /message/{interview_id}.
+    """
+    interview = _get_active_interview(interview_id, current_user, db)
+    session = await asyncio.to_thread(_load_session, interview, current_user, db)
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            async for event in session.stream_next_message(message.message):
+                if event["type"] == "token":
+                    yield _sse({"token": event["content"]})
+                    continue
+
+                # The request-scoped session is closed once streaming starts
+                await _persist_streamed_turn(interview_id, session, message.message, event)
+
+                yield _sse(
+                    InterviewMessageResponse(
+                        interviewer_message=event["message"],
+                        is_complete=event["is_complete"]
+                    ).model_dump(),
+                    event="done"
+                )
+        except Exception as e:
+            yield _sse({"detail": f"Error generating response: {str(e)}"}, event="error")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.websocket("/ws/{interview_id}")
+async def interview_socket(websocket: WebSocket, interview_id: int):
+    """Run the interview conversation over a single WebSocket.
+
+    The connection authenticates once and stays bound to the interview, so
+    turns skip the per-request token decode, user and interview lookups.
+    Messages are JSON:
+
+      client: {"type": "auth", "token": "<JWT>"}          (first message)
+      server: {"type": "ready", "questions_asked": 2}
+      client: {"type": "message", "message": "..."}
+      server: {"type": "token", "content": "..."} per token, then
+              {"type": "done", "interviewer_message": "...", "is_complete": false}
+
+    Failures send {"type": "error", "detail": ...}. Authorization errors,
+    including no auth message within INTERVIEW_WS_AUTH_TIMEOUT_SECONDS,
+    close with 4000 + the HTTP status (e.g. 4401, 4404), and the socket is
+    closed normally after the final turn. Start the interview with
+    POST /start/{interview_id} before connecting.
+    """
+    await websocket.accept()
+
+    try:
+        try:
+            raw_auth = await asyncio.wait_for(
+                websocket.receive_text(),
+                timeout=settings.INTERVIEW_WS_AUTH_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Authentication timed out"
+            )
+        auth = json.loads(raw_auth)
+        db = SessionLocal()
+        try:
+            if not isinstance(auth, dict) or auth.get("type") != "auth":
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="First message must be {\"type\": \"auth\", \"token\": ...}"
+                )
+            user = await get_current_user(auth.get("token") or "", db)
+            interview = _get_active_interview(interview_id, user, db)
+            if interview.status == "pending":
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Start the interview before connecting"
+                )
+            session = await asyncio.to_thread(_load_session, interview, user, db)
+        finally:
+            db.close()
+    except WebSocketDisconnect:
+        return
+    except (HTTPException, ValueError) as e:
+        code = e.status_code if isinstance(e, HTTPException) else status.HTTP_400_BAD_REQUEST
+        await websocket.send_json({"type": "error", "detail": getattr(e, "detail", "Invalid JSON")})
+        await websocket.close(code=4000 + code)
+        return
+
+    await websocket.send_json({"type": "ready", "questions_asked": session.questions_count})
+
+    try:
+        while True:
+            try:
+                data = json.loads(await websocket.receive_text())
+            except ValueError:
+                data = None
+            text = data.get("message") if isinstance(data, dict) and data.get("type") == "message" else None
+            if not isinstance(text, str) or not text.strip():
+                await websocket.send_json({
+                    "type": "error",
+                    "detail": "Expected {\"type\": \"message\", \"message\": ...}"
+                })
+                continue
+
+            async for event in session.stream_next_message(text):
+                if event["type"] == "token":
+                    await websocket.send_json({"type": "token", "content": event["content"]})
+                    continue
+
+                await _persist_streamed_turn(interview_id, session, text, event)
+                await websocket.send_json({
+                    "type": "done",
+                    **InterviewMessageResponse(
+                        interviewer_message=event["message"],
+                        is_complete=event["is_complete"]
+                    ).model_dump()
+                })
+
+                if event["is_complete"]:
+                    await websocket.close()
+                    return
+    except WebSocketDisconnect:
+        return
+    except Exception as e:
+        # The bound session may be mid-turn; reconnecting rehydrates it from persisted turns
+        await websocket.send_json({"type": "error", "detail": f"Error generating response: {str(e)}"})
+        await websocket.close(code=1011)
+
+
 @router.get("/result/{interview_id}")
 def get_interview_result(
     interview_id: int,
@@ -143,51 +400,54 @@ def get_interview_result(
     db: Session = Depends(get_db)
 ):
     """Get the result of a completed interview"""
-    # Candidates can only see their own, recruiters can see all
-    if current_user.role == Role.CANDIDATE.value:
-        interview = db.query(Interview).filter(
-            Interview.id == interview_id,
-            Interview.user_id == current_user.id
-        ).first()
-    else:
-        interview = db.query(Interview).filter(
-            Interview.id == interview_id
-        ).first()
-
-    if not interview:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Interview not found"
-        )
-
-    if interview.status != "completed":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Interview has not been completed yet"
-        )
+    interview = _get_finished_interview(interview_id, current_user, db, undefer_group("transcript"))
 
-    conversation = json.loads(interview.conversation) if interview.conversation else []
-    assessment = json.loads(interview.assessment) if interview.assessment else {}
+    # Until "completed" the transcript is available but score and assessment are not
+    scored = interview.status == "completed"
 
     return {
         "interview_id": interview.id,
         "position": interview.position,
         "company": interview.company,
-        "score": interview.score,
+        "score": interview.score if scored else None,
         "status": interview.status,
         "completed_at": interview.completed_at,
-        "conversation": conversation,
-        "assessment": assessment
+        "conversation": load_conversation(db, interview.id, interview.conversation),
+        "assessment": (interview.assessment or {}) if scored else {}
     }
 
 
+@router.post("/result/{interview_id}/retry")
+async def retry_interview_assessment(
+    interview_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Run the assessment again after it failed"""
+    interview = _get_finished_interview(interview_id, current_user, db)
+
+    if interview.status != "assessment_failed":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only a failed assessment can be retried"
+        )
+
+    retry_assessment(db, interview)
+    return {"interview_id": interview.id, "status": interview.status}
+
+
 @router.post("/upload-cv")
 async def upload_cv(
     file: UploadFile = File(...),
+    background: bool = False,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Upload and parse a CV file"""
+    """Upload and parse a CV file.
+
+    With background=true the upload is queued and 202 is returned with a job
+    id to poll at GET /upload-cv/{job_id}.
+    """
     if current_user.role != Role.CANDIDATE.value:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -203,40 +463,91 @@ async def upload_cv(
             detail=f"Unsupported file type. Allowed: {', '.join(allowed_extensions)}"
         )
 
+    # Spool to disk so memory per upload stays bounded
     try:
-        # Read file content
-        content = await file.read()
+        upload = await spool_upload(file, settings.CV_MAX_UPLOAD_BYTES)
+    except CVTooLargeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=str(e)
+        )
 
-        # Parse CV using AI service
-        ai_service = get_ai_service()
-        cv_text = ai_service.read_cv(content, file.filename)
-        profile = ai_service.extract_profile(cv_text)
+    if background:
+        try:
+            job_id = get_ingestion_queue().submit(current_user.id, upload, file.filename)
+        except IngestionQueueFullError as e:
+            os.remove(upload.path)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail=str(e),
+                headers={"Retry-After": "5"}
+            )
+
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={
+                "job_id": job_id,
+                "status": "queued",
+                "status_url": f"/api/interview/upload-cv/{job_id}"
+            }
+        )
+
+    try:
+        cv_text, profile = await process_cv_file(upload.path, file.filename, upload.content_sha256)
 
         # Update user profile with CV data
-        current_user.cv = cv_text
-        current_user.info = json.dumps({
-            "skills": profile.skills,
-            "experience_years": profile.years_of_experience,
-            "current_position": profile.current_position,
-            "education": profile.education,
-            "work_history": profile.work_history
-        })
+        apply_cv_to_user(current_user, cv_text, profile)
         db.commit()
 
         return {
             "message": "CV uploaded and parsed successfully",
-            "profile": {
-                "name": profile.name,
-                "current_position": profile.current_position,
-                "years_of_experience": profile.years_of_experience,
-                "skills": profile.skills[:10],  # Return top 10 skills
-                "education_count": len(profile.education),
-                "work_history_count": len(profile.work_history)
-            }
+            "profile": profile_summary(profile)
         }
 
+    except CVParseTimeoutError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(e)
+        )
+    except RateLimitError:
+        # Left to the app-level handler, which answers 503 with Retry-After
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing CV: {str(e)}"
         )
+    finally:
+        os.remove(upload.path)
+
+
+@router.get("/upload-cv/{job_id}")
+async def get_upload_status(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get the status of a background CV upload"""
+    # Report a job whose worker died as failed even before a sweep runs
+    await asyncio.to_thread(CVIngestionQueue.fail_stale_jobs, [job_id])
+
+    job = db.query(CVIngestionJob).filter(
+        CVIngestionJob.id == job_id,
+        CVIngestionJob.user_id == current_user.id
+    ).first()
+
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Upload job not found"
+        )
+
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "filename": job.filename,
+        "profile": json.loads(job.result) if job.result else None,
+        "error": job.error,
+        "created_at": job.created_at,
+        "updated_at": job.updated_at
+    }
@@ -1,13 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from typing import List
-import json
+from typing import List, Optional
 
 from ...core.database import get_db
 from ...core.security import get_current_user
 from ...models.user import User, Role
 from ...models.job import Job
 from ...schemas.job import JobCreate, JobResponse, JobUpdate
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, page_response, parse_fields
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
@@ -15,14 +15,18 @@ router = APIRouter(prefix="/jobs", tags=["Jobs"])
 @router.get("", response_model=List[JobResponse])
 def get_all_jobs(
     active_only: bool = True,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get all job listings (public endpoint)"""
+    """Get job listings, newest first, one page at a time (public endpoint)"""
+    selected = parse_fields(fields, JobResponse)
     query = db.query(Job)
     if active_only:
         query = query.filter(Job.is_active == 1)
 
-    jobs = query.order_by(Job.created_at.desc()).all()
+    jobs, next_cursor = keyset_page(query, (Job.created_at, Job.id), cursor, limit)
 
     result = []
     for job in jobs:
@@ -31,8 +35,8 @@ def get_all_jobs(
             "title": job.title,
             "department": job.department,
             "description": job.description,
-            "required_skills": json.loads(job.required_skills) if job.required_skills else [],
-            "preferred_skills": json.loads(job.preferred_skills) if job.preferred_skills else [],
+            "required_skills": job.required_skills or [],
+            "preferred_skills": job.preferred_skills or [],
             "min_experience_years": job.min_experience_years,
             "salary_range": job.salary_range,
             "work_mode": job.work_mode,
@@ -41,7 +45,7 @@ def get_all_jobs(
         }
         result.append(JobResponse(**job_dict))
 
-    return result
+    return page_response(result, next_cursor, selected)
 
 
 @router.get("/{job_id}", response_model=JobResponse)
@@ -60,8 +64,8 @@ def get_job(job_id: int, db: Session = Depends(get_db)):
         title=job.title,
         department=job.department,
         description=job.description,
-        required_skills=json.loads(job.required_skills) if job.required_skills else [],
-        preferred_skills=json.loads(job.preferred_skills) if job.preferred_skills else [],
+        required_skills=job.required_skills or [],
+        preferred_skills=job.preferred_skills or [],
         min_experience_years=job.min_experience_years,
         salary_range=job.salary_range,
         work_mode=job.work_mode,
@@ -87,8 +91,8 @@ def create_job(
         title=job_data.title,
         department=job_data.department,
         description=job_data.description,
-        required_skills=json.dumps(job_data.required_skills),
-        preferred_skills=json.dumps(job_data.preferred_skills) if job_data.preferred_skills else None,
+        required_skills=job_data.required_skills,
+        preferred_skills=job_data.preferred_skills or None,
         min_experience_years=job_data.min_experience_years,
         salary_range=job_data.salary_range,
         work_mode=job_data.work_mode
@@ -140,9 +144,9 @@ def update_job(
     if job_data.description is not None:
         job.description = job_data.description
     if job_data.required_skills is not None:
-        job.required_skills = json.dumps(job_data.required_skills)
+        job.required_skills = job_data.required_skills
     if job_data.preferred_skills is not None:
-        job.preferred_skills = json.dumps(job_data.preferred_skills)
+        job.preferred_skills = job_data.preferred_skills
     if job_data.min_experience_years is not None:
         job.min_experience_years = job_data.min_experience_years
     if job_data.salary_range is not None:
@@ -160,8 +164,8 @@ def update_job(
         title=job.title,
         department=job.department,
         description=job.description,
-        required_skills=json.loads(job.required_skills) if job.required_skills else [],
-        preferred_skills=json.loads(job.preferred_skills) if job.preferred_skills else [],
+        required_skills=job.required_skills or [],
+        preferred_skills=job.preferred_skills or [],
         min_experience_years=job.min_experience_years,
         salary_range=job.salary_range,
         work_mode=job.work_mode,
@@ -1,90 +1,107 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session, undefer_group
+from datetime import datetime, timezone
 from typing import List, Optional
-import json
+import asyncio
+import os
+import zipfile
 
+from ...core.config import settings
 from ...core.database import get_db
 from ...core.security import get_current_user
 from ...models.user import User, Role
 from ...models.interview import Interview
+from ...models.cv_import import CVImportRun, CVImportFile
 from ...schemas.interview import InterviewResponse, InterviewWithUserResponse
+from ..pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, keyset_page, page_response, parse_fields
+from ...services.cv_import import create_import_run, fail_stale_import_runs, import_cvs, iter_cv_files
+from ...services.cv_parser import CVTooLargeError, spool_upload
+from ...services import recruiter_stats
+from ...services.interview_transcript import load_conversation
 
 router = APIRouter(prefix="/recruiter", tags=["Recruiter"])
 
+# Keep references so running imports are not garbage collected
+_import_tasks = set()
+
+
+def _interview_listing_query(db: Session):
+    """Interview and candidate columns for dashboard listings in a single query.
+
+    Only the columns InterviewWithUserResponse needs are selected, so the
+    conversation/assessment blobs are never loaded and no per-row User
+    lookup is issued.
+    """
+    return db.query(
+        Interview.id,
+        Interview.user_id,
+        Interview.position,
+        Interview.company,
+        Interview.score,
+        Interview.status,
+        Interview.created_at,
+        Interview.completed_at,
+        User.name.label("candidate_name"),
+        User.email.label("candidate_email")
+    ).join(User, User.id == Interview.user_id)
+
 
 @router.get("/candidates", response_model=List[InterviewWithUserResponse])
 def get_scored_candidates(
     min_score: int = Query(default=0, ge=0, le=100),
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all interviews with score > 0 (candidates who completed interviews)"""
+    """Get completed interviews with score > min_score, best first, one page at a time"""
     if current_user.role != Role.RECRUITER.value:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only recruiters can access this endpoint"
         )
 
-    interviews = db.query(Interview).join(User).filter(
-        Interview.score > min_score
-    ).order_by(Interview.score.desc()).all()
-
-    result = []
-    for interview in interviews:
-        user = db.query(User).filter(User.id == interview.user_id).first()
-        result.append(InterviewWithUserResponse(
-            id=interview.id,
-            user_id=interview.user_id,
-            position=interview.position,
-            company=interview.company,
-            score=interview.score,
-            status=interview.status,
-            created_at=interview.created_at,
-            completed_at=interview.completed_at,
-            candidate_name=user.name,
-            candidate_email=user.email
-        ))
-
-    return result
+    selected = parse_fields(fields, InterviewWithUserResponse)
+    rows, next_cursor = keyset_page(
+        _interview_listing_query(db).filter(
+            Interview.status == "completed",
+            Interview.score > min_score
+        ),
+        (Interview.score, Interview.id),
+        cursor,
+        limit
+    )
+
+    return page_response([InterviewWithUserResponse(**row._mapping) for row in rows], next_cursor, selected)
 
 
 @router.get("/interviews", response_model=List[InterviewWithUserResponse])
 def get_all_interviews(
     status_filter: Optional[str] = None,
+    limit: int = Query(default=DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all interviews for recruiter dashboard"""
+    """Get interviews for recruiter dashboard, newest first, one page at a time"""
     if current_user.role != Role.RECRUITER.value:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only recruiters can access this endpoint"
         )
 
-    query = db.query(Interview).join(User)
+    selected = parse_fields(fields, InterviewWithUserResponse)
+    query = _interview_listing_query(db)
 
     if status_filter:
         query = query.filter(Interview.status == status_filter)
 
-    interviews = query.order_by(Interview.created_at.desc()).all()
-
-    result = []
-    for interview in interviews:
-        user = db.query(User).filter(User.id == interview.user_id).first()
-        result.append(InterviewWithUserResponse(
-            id=interview.id,
-            user_id=interview.user_id,
-            position=interview.position,
-            company=interview.company,
-            score=interview.score,
-            status=interview.status,
-            created_at=interview.created_at,
-            completed_at=interview.completed_at,
-            candidate_name=user.name,
-            candidate_email=user.email
-        ))
+    rows, next_cursor = keyset_page(query, (Interview.created_at, Interview.id), cursor, limit)
 
-    return result
+    return page_response([InterviewWithUserResponse(**row._mapping) for row in rows], next_cursor, selected)
 
 
 @router.get("/interviews/{interview_id}")
@@ -100,7 +117,9 @@ def get_interview_details(
             detail="Only recruiters can access this endpoint"
         )
 
-    interview = db.query(Interview).filter(Interview.id == interview_id).first()
+    interview = db.query(Interview).options(undefer_group("transcript")).filter(
+        Interview.id == interview_id
+    ).first()
 
     if not interview:
         raise HTTPException(
@@ -108,30 +127,7 @@ def get_interview_details(
             detail="Interview not found"
         )
 
-    user = db.query(User).filter(User.id == interview.user_id).first()
-
-    # Parse JSON fields for proper display
-    conversation = []
-    assessment = {}
-    candidate_info = {}
-
-    if interview.conversation:
-        try:
-            conversation = json.loads(interview.conversation)
-        except json.JSONDecodeError:
-            conversation = []
-
-    if interview.assessment:
-        try:
-            assessment = json.loads(interview.assessment)
-        except json.JSONDecodeError:
-            assessment = {}
-
-    if user.info:
-        try:
-            candidate_info = json.loads(user.info)
-        except json.JSONDecodeError:
-            candidate_info = {}
+    user = db.query(User).options(undefer_group("profile")).filter(User.id == interview.user_id).first()
 
     return {
         "id": interview.id,
@@ -145,9 +141,9 @@ def get_interview_details(
         "candidate_name": user.name,
         "candidate_email": user.email,
         "candidate_cv": user.cv,
-        "candidate_info": candidate_info,
-        "conversation": conversation,
-        "assessment": assessment
+        "candidate_info": user.info or {},
+        "conversation": load_conversation(db, interview.id, interview.conversation),
+        "assessment": interview.assessment or {}
     }
 
 
@@ -163,14 +159,126 @@ def get_recruiter_stats(
             detail="Only recruiters can access this endpoint"
         )
 
-    total_interviews = db.query(Interview).count()
-    completed_interviews = db.query(Interview).filter(Interview.status == "completed").count()
-    pending_interviews = db.query(Interview).filter(Interview.status == "pending").count()
-    high_scorers = db.query(Interview).filter(Interview.score >= 80).count()
+    return recruiter_stats.get_recruiter_stats(db)
+
+
+async def _run_import(run_id: str, archive_path: str):
+    try:
+        await import_cvs(
+            iter_cv_files(archive_path),
+            run_id=run_id,
+            concurrency=settings.CV_IMPORT_CONCURRENCY,
+            batch_size=settings.CV_IMPORT_BATCH_SIZE
+        )
+    except Exception as e:
+        print(f"[CV IMPORT] Run {run_id} failed: {e}")
+    finally:
+        os.remove(archive_path)
+
+
+@router.post("/cv-import")
+async def start_cv_import(
+    file: UploadFile = File(...),
+    current_user: User = Depends(get_current_user)
+):
+    """Bulk-import candidates from a ZIP of PDF/DOCX/TXT CVs.
+
+    Returns 202 with a run id; progress and per-file results are available at
+    GET /cv-import/{run_id}. Files already imported by an earlier run are
+    skipped, so an interrupted import can be resumed by uploading it again.
+    Archives over CV_IMPORT_MAX_ARCHIVE_BYTES are rejected with 413.
+    """
+    if current_user.role != Role.RECRUITER.value:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only recruiters can import CVs"
+        )
+
+    # Spool the archive to disk so the import outlives this request
+    max_bytes = settings.CV_IMPORT_MAX_ARCHIVE_BYTES
+    try:
+        archive_path = (await spool_upload(file, max_bytes)).path
+    except CVTooLargeError:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Archive exceeds the {max_bytes // (1024 * 1024)} MB limit"
+        )
+
+    if not zipfile.is_zipfile(archive_path):
+        os.remove(archive_path)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Upload must be a ZIP archive of CV files"
+        )
+
+    run_id = create_import_run(created_by=current_user.id)
+    task = asyncio.create_task(_run_import(run_id, archive_path))
+    _import_tasks.add(task)
+    task.add_done_callback(_import_tasks.discard)
+
+    return JSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content={
+            "run_id": run_id,
+            "status": "running",
+            "status_url": f"/api/recruiter/cv-import/{run_id}"
+        }
+    )
+
+
+@router.get("/cv-import/{run_id}")
+def get_cv_import(
+    run_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """Get progress, throughput and per-file results of a bulk CV import"""
+    if current_user.role != Role.RECRUITER.value:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Only recruiters can access this endpoint"
+        )
+
+    # Report a run whose process died as failed even before the next sweep
+    fail_stale_import_runs([run_id])
+    run = db.query(CVImportRun).filter(CVImportRun.id == run_id).first()
+    if not run:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Import run not found"
+        )
+
+    files = db.query(CVImportFile).filter(
+        CVImportFile.run_id == run_id
+    ).order_by(CVImportFile.id).all()
+
+    processed = (run.imported or 0) + (run.updated or 0) + (run.failed or 0)
+    started_at = run.started_at
+    finished_at = run.finished_at or datetime.now(timezone.utc)
+    if started_at is not None and started_at.tzinfo is None:
+        started_at = started_at.replace(tzinfo=timezone.utc)
+    if finished_at.tzinfo is None:
+        finished_at = finished_at.replace(tzinfo=timezone.utc)
+    elapsed = (finished_at - started_at).total_seconds() if started_at else 0
 
     return {
-        "total_interviews": total_interviews,
-        "completed_interviews": completed_interviews,
-        "pending_interviews": pending_interviews,
-        "high_scorers": high_scorers
+        "run_id": run.id,
+        "status": run.status,
+        "imported": run.imported,
+        "updated": run.updated,
+        "skipped": run.skipped,
+        "failed": run.failed,
+        "error": run.error,
+        "started_at": run.started_at,
+        "finished_at": run.finished_at,
+        "cvs_per_minute": round(processed / elapsed * 60, 1) if elapsed > 0 else 0.0,
+        "files": [
+            {
+                "filename": f.filename,
+                "status": f.status,
+                "user_id": f.user_id,
+                "error": f.error
+            }
+            for f in files
+        ]
     }
@@ -20,6 +20,94 @@ class Settings(BaseSettings):
     # NVIDIA API for AI features
     NVIDIA_API_KEY: str = ""
 
+    # Shared LLM HTTP connection pool
+    LLM_MAX_CONNECTIONS: int = 100
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    LLM_KEEPALIVE_EXPIRY_SECONDS: float = 60.0
+    LLM_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    LLM_TIMEOUT_SECONDS: float = 120.0
+
+    # LLM call scheduling: concurrent calls, per-minute request and token
+    # budgets (0 = unlimited), and retries of 429/5xx/connection errors.
+    # All limits apply per worker process, not across the deployment.
+    LLM_MAX_CONCURRENT_REQUESTS: int = 32
+    # Of those, slots only live interview turns may use
+    LLM_LIVE_RESERVED_REQUESTS: int = 8
+    LLM_REQUESTS_PER_MINUTE: int = 120
+    LLM_TOKENS_PER_MINUTE: int = 0
+    LLM_MAX_RETRIES: int = 4
+    LLM_RETRY_BASE_DELAY_SECONDS: float = 0.5
+    LLM_RETRY_MAX_DELAY_SECONDS: float = 20.0
+
+    # Interview session storage: "memory" (single worker) or "database" (shared)
+    INTERVIEW_SESSION_BACKEND: str = "memory"
+    INTERVIEW_SESSION_TTL_SECONDS: int = 60 * 60  # evict after 1 hour idle
+    INTERVIEW_SESSION_MAX_ENTRIES: int = 1000
+    INTERVIEW_SESSION_SWEEP_INTERVAL_SECONDS: int = 60
+
+    # WebSocket interviews must send their auth message within this many seconds
+    INTERVIEW_WS_AUTH_TIMEOUT_SECONDS: float = 10.0
+
+    # Generate the opening interviewer message in the background when an interview is created
+    INTERVIEW_PREPARE_OPENING: bool = True
+
+    # Interviewer prompt budget: the last N exchanges are sent verbatim and
+    # older ones are folded into a running summary
+    INTERVIEW_CONTEXT_MAX_TOKENS: int = 8000
+    INTERVIEW_CONTEXT_RECENT_TURNS: int = 3
+
+    # Candidate section of the interviewer prompt: "profile" (structured User.info
+    # plus the most relevant CV chunks, capped at MAX_CHARS, ~4 chars per token)
+    # or "cv" (the full extracted CV text)
+    INTERVIEW_CANDIDATE_CONTEXT: str = "profile"
+    INTERVIEW_CANDIDATE_CONTEXT_MAX_CHARS: int = 3000
+    INTERVIEW_CV_EXCERPT_CHUNKS: int = 3
+
+    # Final assessment: "incremental" (score each answer as it arrives, then
+    # summarize the scores) or "full" (one call over the whole transcript)
+    INTERVIEW_ASSESSMENT_MODE: str = "incremental"
+    # Background assessment attempts before the interview is marked "assessment_failed"
+    INTERVIEW_ASSESSMENT_ATTEMPTS: int = 3
+    INTERVIEW_ASSESSMENT_RETRY_DELAY_SECONDS: float = 5.0
+    # Running assessments heartbeat at this interval; ones silent for the stale
+    # window are taken over by another worker
+    INTERVIEW_ASSESSMENT_HEARTBEAT_SECONDS: int = 30
+    INTERVIEW_ASSESSMENT_STALE_SECONDS: int = 120
+
+    # CV extraction cache: rows kept in the database and in each worker's LRU
+    CV_CACHE_MAX_ENTRIES: int = 10000
+    CV_CACHE_MEMORY_ENTRIES: int = 256
+
+    # CV parsing runs in a process pool; slow documents are killed after the timeout
+    CV_PARSE_WORKERS: int = 2
+    CV_PARSE_TIMEOUT_SECONDS: int = 30
+
+    # Upload and extraction budgets; text past CV_MAX_CHARS is never sent to the LLM
+    CV_MAX_UPLOAD_BYTES: int = 10 * 1024 * 1024
+    CV_MAX_PAGES: int = 30
+    CV_MAX_CHARS: int = 20000
+
+    # Background CV uploads (POST /interview/upload-cv?background=true)
+    CV_INGESTION_WORKERS: int = 4
+    CV_INGESTION_QUEUE_SIZE: int = 100
+    # Workers touch their jobs at this interval; jobs not touched within the
+    # stale window belong to a worker that died and are failed as interrupted
+    CV_INGESTION_HEARTBEAT_SECONDS: int = 30
+    CV_INGESTION_STALE_SECONDS: int = 120
+
+    # Bulk CV import: concurrent LLM extractions and rows written per commit
+    CV_IMPORT_CONCURRENCY: int = 8
+    CV_IMPORT_BATCH_SIZE: int = 50
+    # Uploaded import archives are capped; members over CV_MAX_UPLOAD_BYTES are failed unread
+    CV_IMPORT_MAX_ARCHIVE_BYTES: int = 500 * 1024 * 1024
+    # Running imports touch their run at this interval; runs not touched within
+    # the stale window belong to a process that died and are failed as interrupted
+    CV_IMPORT_HEARTBEAT_SECONDS: int = 30
+    CV_IMPORT_STALE_SECONDS: int = 120
+
+    # Recruiter dashboard counters are cached per worker for this long
+    RECRUITER_STATS_TTL_SECONDS: int = 30
+
     # Email Settings for 2FA
     SMTP_HOST: str = "smtp.gmail.com"
     SMTP_PORT: int = 587
@@ -43,7 +43,7 @@ class RoleChecker:
 
         # CRITICAL: Always fetch user from database to get the real role
         # This prevents any client-side role manipulation
-        user = db.query(User).filter(User.email == email).first()
+        user = db.query(User).options(User.auth_columns()).filter(User.email == email).first()
         if user is None:
             raise credentials_exception
 
@@ -115,7 +115,7 @@ async def get_current_user(
         raise credentials_exception
 
     from ..models.user import User
-    user = db.query(User).filter(User.email == email).first()
+    user = db.query(User).options(User.auth_columns()).filter(User.email == email).first()
     if user is None:
         raise credentials_exception
 
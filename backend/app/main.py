@@ -1,16 +1,62 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from openai import RateLimitError
 from .core.config import settings
 from .core.database import engine, Base
 from .api.routes import auth, candidate, recruiter, jobs, interview
+from .api.pagination import NEXT_CURSOR_HEADER
+from .services.ai_service import get_session_store
+from .services.session_store import run_session_sweeper
+from .services.cv_parser import shutdown_parse_pool
+from .services.cv_ingestion import get_ingestion_queue
+from .services.cv_import import fail_stale_import_runs
+from .services.llm_client import warm_llm_clients, close_llm_clients
+from .services.interview_assessment import resume_assessments
+from .services.heartbeat import run_every
+from .services.llm_scheduler import get_llm_scheduler
 
 # Create tables
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await warm_llm_clients()
+    sweeper = asyncio.create_task(run_session_sweeper(
+        get_session_store(),
+        settings.INTERVIEW_SESSION_SWEEP_INTERVAL_SECONDS
+    ))
+    ingestion_queue = get_ingestion_queue()
+    ingestion_queue.start()
+    fail_stale_import_runs()
+    import_sweeper = asyncio.create_task(run_every(
+        settings.CV_IMPORT_HEARTBEAT_SECONDS,
+        lambda: asyncio.to_thread(fail_stale_import_runs),
+        "CV IMPORT"
+    ))
+    await resume_assessments()
+    assessment_sweeper = asyncio.create_task(run_every(
+        settings.INTERVIEW_ASSESSMENT_HEARTBEAT_SECONDS,
+        resume_assessments,
+        "INTERVIEW"
+    ))
+    yield
+    sweeper.cancel()
+    import_sweeper.cancel()
+    assessment_sweeper.cancel()
+    await ingestion_queue.stop()
+    shutdown_parse_pool()
+    await close_llm_clients()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     description="AI-powered recruitment platform with automated CV screening and interviews",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -20,8 +66,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+@app.exception_handler(RateLimitError)
+async def llm_rate_limited(request: Request, exc: RateLimitError):
+    # Still rate limited after the scheduler's retries
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "AI service is busy, please try again shortly"},
+        headers={"Retry-After": str(int(settings.LLM_RETRY_MAX_DELAY_SECONDS))}
+    )
+
+
 # Include routers
 app.include_router(auth.router, prefix="/api")
 app.include_router(candidate.router, prefix="/api")
@@ -42,3 +99,14 @@ def root():
 @app.get("/health")
 def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/health/sessions")
+def session_stats():
+    return get_session_store().stats()
+
+
+@app.get("/health/llm")
+def llm_stats():
+    """LLM scheduler queue depth, in-flight calls and wait times per priority class"""
+    return get_llm_scheduler().metrics()
@@ -2,5 +2,13 @@ from .user import User, Role
 from .interview import Interview
 from .job import Job
 from .two_factor import TwoFactorCode, TwoFactorSession
+from .interview_session import InterviewSessionState
+from .cv_cache import CVExtractionCache
+from .cv_ingestion_job import CVIngestionJob
+from .cv_import import CVImportRun, CVImportFile
+from .interview_message import InterviewMessage
+from .interview_answer_score import InterviewAnswerScore
 
-__all__ = ["User", "Role", "Interview", "Job", "TwoFactorCode", "TwoFactorSession"]
\ No newline at end of file
+__all__ = ["User", "Role", "Interview", "Job", "TwoFactorCode", "TwoFactorSession", "InterviewSessionState",
+           "CVExtractionCache", "CVIngestionJob",
+           "CVImportRun", "CVImportFile", "InterviewMessage", "InterviewAnswerScore"]
\ No newline at end of file
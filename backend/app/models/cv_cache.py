@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class CVExtractionCache(Base):
+    """Parsed CV text and extracted profile keyed by upload content and prompt"""
+    __tablename__ = "cv_extraction_cache"
+
+    cache_key = Column(String(64), primary_key=True)  # sha256(content hash, model, prompt version)
+    content_sha256 = Column(String(64), nullable=False, index=True)
+    model = Column(String(255), nullable=False)
+    prompt_version = Column(String(20), nullable=False)
+    cv_text = Column(Text, nullable=False)
+    profile = Column(Text, nullable=False)  # JSON of CandidateProfile
+    hit_count = Column(Integer, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_used_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class CVImportRun(Base):
+    """A recruiter-initiated bulk CV import"""
+    __tablename__ = "cv_import_runs"
+
+    id = Column(String(36), primary_key=True)  # uuid4
+    created_by = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    status = Column(String(20), nullable=False, default="running")  # running, completed, failed
+    imported = Column(Integer, default=0)
+    updated = Column(Integer, default=0)
+    skipped = Column(Integer, default=0)
+    failed = Column(Integer, default=0)
+    error = Column(Text, nullable=True)
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)  # touched while the import runs
+
+
+class CVImportFile(Base):
+    """Outcome for one file of a bulk import; completed hashes are skipped on resume"""
+    __tablename__ = "cv_import_files"
+
+    id = Column(Integer, primary_key=True, index=True)
+    run_id = Column(String(36), ForeignKey("cv_import_runs.id", ondelete="CASCADE"), nullable=False, index=True)
+    filename = Column(String(512), nullable=False)
+    content_sha256 = Column(String(64), nullable=False, index=True)
+    status = Column(String(20), nullable=False)  # imported, updated, failed
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class CVIngestionJob(Base):
+    """Background CV upload processed by an ingestion worker"""
+    __tablename__ = "cv_ingestion_jobs"
+
+    id = Column(String(36), primary_key=True)  # uuid4
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    filename = Column(String(255), nullable=False)
+    status = Column(String(20), nullable=False, default="queued")  # queued, processing, completed, failed
+    error = Column(Text, nullable=True)
+    result = Column(Text, nullable=True)  # JSON profile summary
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,21 +1,49 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Index
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
-from ..core.database import Base
+from ..core.database import Base, JSONType
 
 
 class Interview(Base):
     __tablename__ = "interviews"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    # Lookups by user are served by ix_interviews_user_created_at_id
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     position = Column(String(255), nullable=False)
     company = Column(String(255), nullable=True)
-    score = Column(Integer, default=0, index=True)
-    status = Column(String(50), default="pending")  # pending, in_progress, completed
-    conversation = Column(Text, nullable=True)  # JSON string of conversation history
-    assessment = Column(Text, nullable=True)  # JSON string of AI assessment
+    # Score ordering is only used for completed interviews: ix_interviews_completed_score_id
+    score = Column(Integer, default=0)
+    status = Column(String(50), default="pending")  # pending, in_progress, assessing, assessment_failed, completed
+    # Large blobs are only loaded on access or with undefer_group("transcript")
+    conversation = deferred(Column(JSONType, nullable=True), group="transcript")  # list of {role, content}
+    assessment = deferred(Column(JSONType, nullable=True), group="transcript")  # AI assessment object
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    # Touched by the worker running the assessment; a stale value means it died
+    assessment_heartbeat_at = Column(DateTime(timezone=True), nullable=True)
 
     user = relationship("User", back_populates="interviews")
+
+    # Match the keyset orderings used by the dashboard and candidate listings
+    __table_args__ = (
+        Index("ix_interviews_created_at_id", created_at.desc(), id.desc()),
+        Index("ix_interviews_status_created_at_id", status, created_at.desc(), id.desc()),
+        Index("ix_interviews_user_created_at_id", user_id, created_at.desc(), id.desc()),
+        Index(
+            "ix_interviews_completed_score_id", score.desc(), id.desc(),
+            postgresql_where=(status == "completed"),
+            sqlite_where=(status == "completed")
+        ),
+        Index(
+            "ix_interviews_assessment_gin", assessment,
+            postgresql_using="gin", postgresql_ops={"assessment": "jsonb_path_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+# Range filters on a rubric score, e.g. assessment["cultural_fit"].as_float() >= 8;
+# containment (GIN) cannot answer those. Queries must use the same expression.
+Index(
+    "ix_interviews_cultural_fit", Interview.assessment["cultural_fit"].as_float()
+).ddl_if(dialect="postgresql")
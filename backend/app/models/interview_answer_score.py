@@ -0,0 +1,27 @@
+from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class InterviewAnswerScore(Base):
+    """Rubric scores for one candidate answer, written shortly after the answer"""
+    __tablename__ = "interview_answer_scores"
+
+    id = Column(Integer, primary_key=True)
+    interview_id = Column(Integer, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)  # interview_messages.seq of the scored answer
+    # 1-10 per rubric dimension; null when the model left it out
+    skills_match = Column(Integer, nullable=True)
+    cultural_fit = Column(Integer, nullable=True)
+    communication = Column(Integer, nullable=True)
+    motivation = Column(Integer, nullable=True)
+    experience_relevance = Column(Integer, nullable=True)
+    note = Column(Text, nullable=True)  # one-sentence justification used in the final summary
+    prompt_tokens = Column(Integer, nullable=True)
+    completion_tokens = Column(Integer, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # One score per answer; a duplicate scoring run is rejected
+    __table_args__ = (
+        UniqueConstraint("interview_id", "seq", name="uq_interview_answer_scores_interview_id_seq"),
+    )
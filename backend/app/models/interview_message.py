@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class InterviewMessage(Base):
+    """One transcript entry, appended as each interview turn completes"""
+    __tablename__ = "interview_messages"
+
+    id = Column(Integer, primary_key=True)
+    interview_id = Column(Integer, ForeignKey("interviews.id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)  # 1-based position in the transcript
+    role = Column(String(20), nullable=False)  # user, assistant
+    content = Column(Text, nullable=False)
+    prompt_tokens = Column(Integer, nullable=True)  # assistant turns; estimated when the API reports no usage
+    completion_tokens = Column(Integer, nullable=True)
+    latency_ms = Column(Integer, nullable=True)  # time to generate the assistant reply
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Also serves in-order reads of a transcript
+    __table_args__ = (
+        UniqueConstraint("interview_id", "seq", name="uq_interview_messages_interview_id_seq"),
+    )
@@ -0,0 +1,12 @@
+from sqlalchemy import Column, Integer, LargeBinary, ForeignKey, DateTime
+from sqlalchemy.sql import func
+from ..core.database import Base
+
+
+class InterviewSessionState(Base):
+    """Serialized InterviewSimulator state shared between workers"""
+    __tablename__ = "interview_sessions"
+
+    interview_id = Column(Integer, ForeignKey("interviews.id", ondelete="CASCADE"), primary_key=True)
+    state = Column(LargeBinary, nullable=False)  # zlib-compressed JSON
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime
+from sqlalchemy import Column, Integer, String, Text, Float, DateTime, Index
 from sqlalchemy.sql import func
-from ..core.database import Base
+from ..core.database import Base, JSONType
 
 
 class Job(Base):
@@ -10,10 +10,18 @@ class Job(Base):
     title = Column(String(255), nullable=False)
     department = Column(String(255), nullable=False)
     description = Column(Text, nullable=False)
-    required_skills = Column(Text, nullable=False)  # JSON array
-    preferred_skills = Column(Text, nullable=True)  # JSON array
+    required_skills = Column(JSONType, nullable=False)  # array of skill names
+    preferred_skills = Column(JSONType, nullable=True)  # array of skill names
     min_experience_years = Column(Float, default=0)
     salary_range = Column(String(100), nullable=True)
     work_mode = Column(String(50), default="Hybrid")  # Remote, Hybrid, Onsite
     is_active = Column(Integer, default=1)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Containment lookups such as required_skills @> '["Python"]'
+    __table_args__ = (
+        Index(
+            "ix_jobs_required_skills_gin", required_skills,
+            postgresql_using="gin", postgresql_ops={"required_skills": "jsonb_path_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
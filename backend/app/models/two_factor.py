@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from ..core.database import Base
@@ -44,6 +44,10 @@ class TwoFactorSession(Base):
     # Relationship to user
     user = relationship("User", back_populates="two_factor_sessions")
 
+    __table_args__ = (
+        Index("ix_two_factor_sessions_user_id_expires_at", user_id, expires_at),
+    )
+
     def is_expired(self) -> bool:
         """Check if the session has expired."""
         return datetime.utcnow() > self.expires_at
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, Enum, Boolean
-from sqlalchemy.orm import relationship
-from ..core.database import Base
+from sqlalchemy import Column, Integer, String, Text, Enum, Boolean, Index
+from sqlalchemy.orm import relationship, deferred, load_only
+from ..core.database import Base, JSONType
 import enum
 
 
@@ -17,8 +17,9 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=False, index=True)
     password = Column(String(255), nullable=False)
     role = Column(String(50), nullable=False, default=Role.CANDIDATE.value)
-    info = Column(Text, nullable=True)
-    cv = Column(Text, nullable=True)
+    # Large blobs are only loaded on access or with undefer_group("profile")
+    info = deferred(Column(JSONType, nullable=True), group="profile")
+    cv = deferred(Column(Text, nullable=True), group="profile")
     two_factor_enabled = Column(Boolean, default=False)  # 2FA disabled by default
     totp_secret = Column(String(32), nullable=True)  # Secret for Google Authenticator
     totp_confirmed = Column(Boolean, default=False)  # Whether TOTP is set up and confirmed
@@ -27,6 +28,22 @@ class User(Base):
     two_factor_codes = relationship("TwoFactorCode", back_populates="user", cascade="all, delete-orphan")
     two_factor_sessions = relationship("TwoFactorSession", back_populates="user", cascade="all, delete-orphan")
 
+    # Containment lookups such as info @> '{"skills": ["Python"]}'
+    __table_args__ = (
+        Index(
+            "ix_users_info_gin", info,
+            postgresql_using="gin", postgresql_ops={"info": "jsonb_path_ops"}
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    @classmethod
+    def auth_columns(cls):
+        """Columns needed to authenticate and authorize a request"""
+        return load_only(
+            cls.id, cls.name, cls.email, cls.password, cls.role,
+            cls.two_factor_enabled, cls.totp_secret, cls.totp_confirmed
+        )
+
     @property
     def email_prefix(self) -> str:
         return self.email.split("@")[0] if self.email else ""
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Optional, Dict, Any
 from enum import Enum
 
 
@@ -25,14 +25,14 @@ class UserLogin(BaseModel):
 
 class UserUpdate(BaseModel):
     name: Optional[str] = None
-    info: Optional[str] = None
+    info: Optional[Dict[str, Any]] = None
     cv: Optional[str] = None
 
 
 class UserResponse(UserBase):
     id: int
     role: str
-    info: Optional[str] = None
+    info: Optional[Dict[str, Any]] = None
     cv: Optional[str] = None
     two_factor_enabled: bool = False
     totp_confirmed: bool = False
@@ -46,7 +46,7 @@ class UserProfileResponse(BaseModel):
     name: str
     email: str
     role: str
-    info: Optional[str] = None
+    info: Optional[Dict[str, Any]] = None
     cv: Optional[str] = None
     two_factor_enabled: bool = False
     totp_confirmed: bool = False
@@ -1,14 +1,31 @@
-import os
 import json
-from typing import List, Dict, Optional, Any
+import time
+import asyncio
+from typing import List, Dict, Optional, Any, AsyncIterator, Iterable, Set
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from openai import OpenAI
-import PyPDF2
-import docx
-from io import BytesIO
 
 from ..core.config import settings
+from . import cv_parser
+from .llm_client import get_async_llm_client
+from .conversation_context import ConversationContext, estimate_messages_tokens
+from .llm_scheduler import Priority, get_llm_scheduler
+
+
+# Bump whenever the profile extraction prompt changes so cached extractions are not reused
+PROFILE_PROMPT_VERSION = "1"
+
+
+def _strip_code_fences(content: str) -> str:
+    """Remove markdown code fences the model sometimes wraps JSON in"""
+    content = content.strip()
+    if content.startswith('```json'):
+        content = content[7:]
+    if content.startswith('```'):
+        content = content[3:]
+    if content.endswith('```'):
+        content = content[:-3]
+    return content.strip()
 
 
 @dataclass
@@ -66,39 +83,30 @@ class JobRequirements:
 
 class AIService:
     def __init__(self):
-        self.client = OpenAI(
-            base_url="https://integrate.api.nvidia.com/v1",
-            api_key=settings.NVIDIA_API_KEY
-        )
+        self.async_client = get_async_llm_client()
         self.model = "meta/llama-3.1-405b-instruct"
 
     def read_pdf(self, file_content: bytes) -> str:
         """Extract text from PDF file content"""
-        text = ""
-        pdf_reader = PyPDF2.PdfReader(BytesIO(file_content))
-        for page in pdf_reader.pages:
-            text += page.extract_text()
-        return text
+        return cv_parser.read_pdf(file_content)
 
     def read_docx(self, file_content: bytes) -> str:
         """Extract text from DOCX file content"""
-        doc = docx.Document(BytesIO(file_content))
-        return '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+        return cv_parser.read_docx(file_content)
 
     def read_cv(self, file_content: bytes, filename: str) -> str:
         """Read CV content based on file extension"""
-        ext = os.path.splitext(filename)[1].lower()
-        if ext == '.pdf':
-            return self.read_pdf(file_content)
-        elif ext in ['.docx', '.doc']:
-            return self.read_docx(file_content)
-        elif ext == '.txt':
-            return file_content.decode('utf-8')
-        else:
-            raise ValueError(f"Unsupported file format: {ext}")
-
-    def extract_profile(self, cv_text: str) -> CandidateProfile:
-        """Extract candidate profile from CV text using AI"""
+        return cv_parser.parse_cv(file_content, filename)
+
+    async def read_cv_async(self, file_content: bytes, filename: str) -> str:
+        """Read CV content in the parser process pool"""
+        return await cv_parser.parse_cv_async(file_content, filename)
+
+    async def read_cv_file_async(self, path: str, filename: str) -> str:
+        """Read a CV spooled to disk in the parser process pool"""
+        return await cv_parser.parse_cv_file_async(path, filename)
+
+    def _profile_messages(self, cv_text: str) -> List[Dict[str, str]]:
         prompt = f"""Extract the following information from this CV and return ONLY valid JSON with this exact structure:
 
 {{
@@ -119,28 +127,13 @@ CV Text:
 
 Return ONLY the JSON, no other text."""
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[
-                {"role": "system", "content": "You are a CV parsing assistant. Extract information and return only valid JSON."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-            max_tokens=2000
-        )
-
-        content = response.choices[0].message.content.strip()
-
-        # Clean up markdown code blocks if present
-        if content.startswith('```json'):
-            content = content[7:]
-        if content.startswith('```'):
-            content = content[3:]
-        if content.endswith('```'):
-            content = content[:-3]
-        content = content.strip()
+        return [
+            {"role": "system", "content": "You are a CV parsing assistant. Extract information and return only valid JSON."},
+            {"role": "user", "content": prompt}
+        ]
 
-        data = json.loads(content)
+    def _parse_profile(self, content: str) -> CandidateProfile:
+        data = json.loads(_strip_code_fences(content))
 
         return CandidateProfile(
             name=data.get("name", "Unknown"),
@@ -155,24 +148,173 @@ Return ONLY the JSON, no other text."""
             languages=data.get("languages", [])
         )
 
+    async def extract_profile_async(
+        self,
+        cv_text: str,
+        priority: Priority = Priority.CV_EXTRACTION
+    ) -> CandidateProfile:
+        """Extract candidate profile without blocking the event loop"""
+        response = await get_llm_scheduler().create(
+            self.async_client, priority,
+            model=self.model,
+            messages=self._profile_messages(cv_text),
+            temperature=0.2,
+            max_tokens=2000
+        )
+
+        return self._parse_profile(response.choices[0].message.content)
+
+
+# Dimensions scored per answer and averaged into the final assessment
+RUBRIC_DIMENSIONS = ("skills_match", "cultural_fit", "communication", "motivation", "experience_relevance")
+
+
+def _clamp_score(value: Any) -> Optional[int]:
+    try:
+        return min(10, max(1, round(float(value))))
+    except (TypeError, ValueError):
+        return None
+
+
+class AnswerScorer:
+    """Scores single answers as they arrive and aggregates them into an assessment.
+
+    Each call sends one question/answer pair or a few lines of scores, so
+    prompt size does not grow with the interview.
+    """
 
-class InterviewSimulator:
     def __init__(self):
-        self.client = OpenAI(
-            base_url="https://integrate.api.nvidia.com/v1",
-            api_key=settings.NVIDIA_API_KEY
+        self.async_client = get_async_llm_client()
+        self.model = "meta/llama-3.1-405b-instruct"
+
+    def _answer_messages(self, position: str, question: str, answer: str) -> List[Dict[str, str]]:
+        prompt = f"""Score this interview answer from a candidate for the {position} position.
+
+Interviewer question:
+{question}
+
+Candidate answer:
+{answer}
+
+Return a JSON object with a 1-10 score for each dimension the answer gives evidence for:
+{{
+    "skills_match": <1-10>,
+    "cultural_fit": <1-10>,
+    "communication": <1-10>,
+    "motivation": <1-10>,
+    "experience_relevance": <1-10>,
+    "note": "one sentence on what the answer shows"
+}}
+
+Return ONLY the JSON, no other text."""
+
+        return [
+            {"role": "system", "content": "You are an HR interviewer scoring candidate answers. Return only valid JSON."},
+            {"role": "user", "content": prompt}
+        ]
+
+    async def score_answer_async(self, position: str, question: str, answer: str) -> Dict[str, Any]:
+        """Rubric scores and a short note for one answer; unparseable output scores nothing"""
+        response = await get_llm_scheduler().create(
+            self.async_client, Priority.ASSESSMENT,
+            model=self.model,
+            messages=self._answer_messages(position, question, answer),
+            temperature=0.2,
+            max_tokens=200
+        )
+
+        try:
+            data = json.loads(_strip_code_fences(response.choices[0].message.content))
+        except json.JSONDecodeError:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+
+        score = {dimension: _clamp_score(data.get(dimension)) for dimension in RUBRIC_DIMENSIONS}
+        score["note"] = str(data.get("note") or "")[:500] or None
+        score["prompt_tokens"] = getattr(response.usage, "prompt_tokens", None)
+        score["completion_tokens"] = getattr(response.usage, "completion_tokens", None)
+        return score
+
+    def _summary_messages(self, position: str, answer_scores: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        lines = []
+        for number, score in enumerate(answer_scores, 1):
+            marks = ", ".join(f"{d} {score[d]}" for d in RUBRIC_DIMENSIONS if score.get(d) is not None)
+            lines.append(f"Answer {number} ({marks or 'not scored'}): {score.get('note') or '-'}")
+        notes = "\n".join(lines)
+
+        prompt = f"""These are per-answer scores and notes from an interview for the {position} position:
+
+{notes}
+
+Return a JSON object with:
+{{
+    "strengths": ["strength1", "strength2", "strength3"],
+    "concerns": ["concern1", "concern2"],
+    "recommendation": "Strong Yes | Yes | Maybe | No",
+    "summary": "2-3 sentence summary of the candidate"
+}}
+
+Return ONLY the JSON, no other text."""
+
+        return [
+            {"role": "system", "content": "You are an HR interviewer writing the final assessment. Return only valid JSON."},
+            {"role": "user", "content": prompt}
+        ]
+
+    async def aggregate_async(self, position: str, answer_scores: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Final assessment: averaged rubric scores plus a short written summary"""
+        assessment: Dict[str, Any] = {}
+        for dimension in RUBRIC_DIMENSIONS:
+            values = [score[dimension] for score in answer_scores if score.get(dimension) is not None]
+            assessment[dimension] = round(sum(values) / len(values), 1) if values else None
+
+        scored = [value for value in assessment.values() if value is not None]
+        assessment["overall_score"] = round(sum(scored) / len(scored) * 10) if scored else 50
+
+        response = await get_llm_scheduler().create(
+            self.async_client, Priority.ASSESSMENT,
+            model=self.model,
+            messages=self._summary_messages(position, answer_scores),
+            temperature=0.3,
+            max_tokens=400
         )
+
+        try:
+            summary = json.loads(_strip_code_fences(response.choices[0].message.content))
+        except json.JSONDecodeError:
+            summary = {"raw_assessment": response.choices[0].message.content, "error": "Failed to parse assessment"}
+        if isinstance(summary, dict):
+            # Scores come from the stored per-answer marks, not the summary call
+            assessment.update({k: v for k, v in summary.items() if k not in assessment})
+
+        assessment["answers_scored"] = len(answer_scores)
+        return assessment
+
+
+class InterviewSimulator:
+    def __init__(self):
+        self.async_client = get_async_llm_client()
         self.model = "meta/llama-3.1-405b-instruct"
         self.conversation_history: List[Dict[str, str]] = []
         self.candidate_profile: Optional[str] = None
         self.job_info: Optional[Dict] = None
         self.questions_count = 0
         self.max_questions = 5
+        self.context = ConversationContext(
+            settings.INTERVIEW_CONTEXT_MAX_TOKENS,
+            settings.INTERVIEW_CONTEXT_RECENT_TURNS
+        )
+
+    @property
+    def is_initialized(self) -> bool:
+        return self.job_info is not None
 
     def initialize(self, candidate_cv: str, job_position: str, job_description: str = None):
         """Initialize interview session"""
         self.conversation_history = []
         self.questions_count = 0
+        self.context.reset()
 
         self.candidate_profile = candidate_cv
         self.job_info = {
@@ -214,8 +356,8 @@ Interview Flow:
 
 IMPORTANT: Only ask ONE question at a time. Wait for the candidate's response before asking the next question."""
 
-    def get_next_message(self, candidate_response: Optional[str] = None) -> Dict[str, Any]:
-        """Get next interviewer message based on candidate's response"""
+    def _begin_turn(self, candidate_response: Optional[str]) -> bool:
+        """Record the candidate's answer and return whether this is the final turn"""
         if candidate_response:
             self.conversation_history.append({
                 "role": "user",
@@ -234,16 +376,16 @@ IMPORTANT: Only ask ONE question at a time. Wait for the candidate's response be
                 "content": closing_prompt
             })
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=self.conversation_history,
-            temperature=0.7,
-            top_p=0.9,
-            max_tokens=500
-        )
-
-        interviewer_message = response.choices[0].message.content
+        return is_complete
 
+    def _finish_turn(
+        self,
+        interviewer_message: str,
+        is_complete: bool,
+        started: float,
+        messages: List[Dict[str, str]],
+        usage: Any = None
+    ) -> Dict[str, Any]:
         self.conversation_history.append({
             "role": "assistant",
             "content": interviewer_message
@@ -252,11 +394,117 @@ IMPORTANT: Only ask ONE question at a time. Wait for the candidate's response be
         return {
             "message": interviewer_message,
             "is_complete": is_complete,
-            "questions_asked": self.questions_count
+            "questions_asked": self.questions_count,
+            # Estimated when the API does not report usage (e.g. for streams)
+            "prompt_tokens": getattr(usage, "prompt_tokens", None) or estimate_messages_tokens(messages),
+            "completion_tokens": getattr(usage, "completion_tokens", None),
+            "latency_ms": int((time.monotonic() - started) * 1000)
         }
 
-    def generate_assessment(self) -> Dict[str, Any]:
-        """Generate final assessment of the interview"""
+    async def get_next_message_async(
+        self,
+        candidate_response: Optional[str] = None,
+        priority: Priority = Priority.LIVE
+    ) -> Dict[str, Any]:
+        """Get next interviewer message without blocking the event loop.
+
+        `priority` is LIVE for a candidate waiting on the reply; work nobody
+        is waiting on yet, such as a prepared opening, should pass a lower class.
+        """
+        is_complete = self._begin_turn(candidate_response)
+        messages = self.context.build(self.conversation_history)
+        started = time.monotonic()
+
+        response = await get_llm_scheduler().create(
+            self.async_client, priority,
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            top_p=0.9,
+            max_tokens=500
+        )
+
+        return self._finish_turn(response.choices[0].message.content, is_complete, started, messages, response.usage)
+
+    async def stream_next_message(self, candidate_response: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the next interviewer message token by token.
+
+        Yields {"type": "token", "content": ...} events while the model is
+        generating, then a single {"type": "done", ...} event carrying the same
+        payload as get_next_message_async once the reply has been recorded.
+        """
+        is_complete = self._begin_turn(candidate_response)
+        messages = self.context.build(self.conversation_history)
+        started = time.monotonic()
+
+        stream = get_llm_scheduler().stream(
+            self.async_client, Priority.LIVE,
+            model=self.model,
+            messages=messages,
+            temperature=0.7,
+            top_p=0.9,
+            max_tokens=500
+        )
+
+        parts: List[str] = []
+        usage = None
+        async for chunk in stream:
+            # Servers that report usage for streams send it on the final chunk
+            usage = getattr(chunk, "usage", None) or usage
+            if not chunk.choices:
+                continue
+            token = chunk.choices[0].delta.content
+            if token:
+                parts.append(token)
+                yield {"type": "token", "content": token}
+
+        result = self._finish_turn(''.join(parts), is_complete, started, messages, usage)
+        yield {"type": "done", **result}
+
+    def _summary_messages(self, turns: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        transcript = "\n".join(
+            f"{'Candidate' if turn['role'] == 'user' else 'Interviewer'}: {turn['content']}"
+            for turn in turns if turn["role"] != "system"
+        )
+        prompt = f"""Current summary of the interview:
+{self.context.summary or "(none yet)"}
+
+New exchanges:
+{transcript}
+
+Rewrite the summary so it covers everything above in under 150 words. Keep what the candidate said about their experience, skills and motivation, and which topics have already been covered. Return only the summary."""
+
+        return [
+            {"role": "system", "content": "You keep a running summary of an HR interview."},
+            {"role": "user", "content": prompt}
+        ]
+
+    async def refresh_summary_async(self) -> bool:
+        """Fold turns that left the verbatim window into the running summary.
+
+        Returns False when there was nothing to fold or the conversation was
+        reset while the summary was being generated.
+        """
+        history = self.conversation_history
+        turns = self.context.pending(history)
+        if not turns:
+            return False
+        summarized = self.context.summarized
+
+        response = await get_llm_scheduler().create(
+            self.async_client, Priority.ASSESSMENT,
+            model=self.model,
+            messages=self._summary_messages(turns),
+            temperature=0.2,
+            max_tokens=300
+        )
+
+        if self.conversation_history is not history or self.context.summarized != summarized:
+            return False
+        self.context.apply_summary(response.choices[0].message.content.strip(), summarized + len(turns))
+        return True
+
+    def _assessment_messages(self) -> List[Dict[str, str]]:
         assessment_prompt = f"""Based on the interview conversation, provide a comprehensive assessment of the candidate for the {self.job_info['position']} position.
 
 Evaluate and return a JSON object with:
@@ -275,28 +523,13 @@ Evaluate and return a JSON object with:
 
 Return ONLY the JSON, no other text."""
 
-        assessment_messages = self.conversation_history + [{
+        return self.conversation_history + [{
             "role": "user",
             "content": assessment_prompt
         }]
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=assessment_messages,
-            temperature=0.3,
-            max_tokens=1000
-        )
-
-        content = response.choices[0].message.content.strip()
-
-        # Clean up markdown code blocks if present
-        if content.startswith('```json'):
-            content = content[7:]
-        if content.startswith('```'):
-            content = content[3:]
-        if content.endswith('```'):
-            content = content[:-3]
-        content = content.strip()
+    def _parse_assessment(self, content: str) -> Dict[str, Any]:
+        content = _strip_code_fences(content)
 
         try:
             assessment = json.loads(content)
@@ -307,16 +540,72 @@ Return ONLY the JSON, no other text."""
                 "error": "Failed to parse assessment"
             }
 
+        if isinstance(assessment, dict):
+            # Stored rubric scores must be numbers or null for the numeric range index
+            for dimension in RUBRIC_DIMENSIONS:
+                if dimension in assessment:
+                    assessment[dimension] = _clamp_score(assessment[dimension])
+
         return assessment
 
+    async def generate_assessment_async(self) -> Dict[str, Any]:
+        """Generate final assessment without blocking the event loop"""
+        response = await get_llm_scheduler().create(
+            self.async_client, Priority.ASSESSMENT,
+            model=self.model,
+            messages=self._assessment_messages(),
+            temperature=0.3,
+            max_tokens=1000
+        )
+
+        return self._parse_assessment(response.choices[0].message.content)
+
+    def restore_turns(self, turns: Iterable[Dict[str, str]]):
+        """Replay persisted transcript turns onto a freshly initialized session"""
+        for turn in turns:
+            self.conversation_history.append({
+                "role": turn["role"],
+                "content": turn["content"]
+            })
+            if turn["role"] == "user":
+                self.questions_count += 1
+
     def get_conversation_history(self) -> List[Dict[str, str]]:
         """Get conversation history without system messages"""
         return [msg for msg in self.conversation_history if msg["role"] != "system"]
 
+    def to_state(self) -> Dict[str, Any]:
+        """Serialize session state. The system prompt is rebuilt on load."""
+        history = self.conversation_history
+        if history and history[0]["role"] == "system":
+            history = history[1:]
+        return {
+            "profile": self.candidate_profile,
+            "job": self.job_info,
+            "questions": self.questions_count,
+            "max_questions": self.max_questions,
+            "history": history,
+            "context": self.context.to_state()
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "InterviewSimulator":
+        session = cls()
+        session.candidate_profile = state["profile"]
+        session.job_info = state["job"]
+        session.questions_count = state["questions"]
+        session.max_questions = state["max_questions"]
+        session.conversation_history = [{
+            "role": "system",
+            "content": session._create_system_prompt()
+        }] + state["history"]
+        session.context.load_state(state.get("context"))
+        return session
+
 
 # Singleton instances
 _ai_service: Optional[AIService] = None
-_interview_sessions: Dict[int, InterviewSimulator] = {}
+_session_store = None
 
 
 def get_ai_service() -> AIService:
@@ -326,12 +615,50 @@ def get_ai_service() -> AIService:
     return _ai_service
 
 
+def get_session_store():
+    global _session_store
+    if _session_store is None:
+        from .session_store import create_session_store
+        _session_store = create_session_store(settings.INTERVIEW_SESSION_BACKEND)
+    return _session_store
+
+
 def get_interview_session(interview_id: int) -> InterviewSimulator:
-    if interview_id not in _interview_sessions:
-        _interview_sessions[interview_id] = InterviewSimulator()
-    return _interview_sessions[interview_id]
+    session = get_session_store().get(interview_id)
+    if session is None:
+        session = InterviewSimulator()
+    return session
+
+
+def save_interview_session(interview_id: int, session: InterviewSimulator):
+    get_session_store().save(interview_id, session)
 
 
 def remove_interview_session(interview_id: int):
-    if interview_id in _interview_sessions:
-        del _interview_sessions[interview_id]
+    get_session_store().delete(interview_id)
+
+
+# Keep references so running summaries are not garbage collected
+_summary_tasks: Set[asyncio.Task] = set()
+
+
+def schedule_context_summary(interview_id: int, session: InterviewSimulator):
+    """Update the session's running summary after a turn without delaying the reply.
+
+    If another worker moved the interview on meanwhile, the saved session is
+    behind the transcript and gets rehydrated on the next turn.
+    """
+    if not session.context.pending(session.conversation_history):
+        return
+
+    async def run():
+        try:
+            # A finished interview's session has already been removed
+            if await session.refresh_summary_async() and session.questions_count < session.max_questions:
+                await asyncio.to_thread(save_interview_session, interview_id, session)
+        except Exception as e:
+            print(f"[INTERVIEW] Context summary for {interview_id} failed: {e}")
+
+    task = asyncio.create_task(run())
+    _summary_tasks.add(task)
+    task.add_done_callback(_summary_tasks.discard)
@@ -0,0 +1,128 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Set
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.interview import Interview
+from ..models.interview_message import InterviewMessage
+from ..models.interview_answer_score import InterviewAnswerScore
+from .ai_service import RUBRIC_DIMENSIONS, AnswerScorer
+
+_scorer: Optional[AnswerScorer] = None
+
+# In-flight scoring per interview, awaited before the final aggregation
+_scoring_tasks: Dict[int, Set[asyncio.Task]] = {}
+
+
+def get_answer_scorer() -> AnswerScorer:
+    global _scorer
+    if _scorer is None:
+        _scorer = AnswerScorer()
+    return _scorer
+
+
+def incremental_scoring_enabled() -> bool:
+    return settings.INTERVIEW_ASSESSMENT_MODE == "incremental"
+
+
+def schedule_answer_scoring(interview_id: int, answer_seq: Optional[int]):
+    """Score a candidate answer in the background (incremental assessment mode only)"""
+    if not answer_seq or not incremental_scoring_enabled():
+        return
+
+    task = asyncio.create_task(score_answer(interview_id, answer_seq))
+    tasks = _scoring_tasks.setdefault(interview_id, set())
+    tasks.add(task)
+
+    def _done(finished: asyncio.Task):
+        tasks.discard(finished)
+        if not tasks and _scoring_tasks.get(interview_id) is tasks:
+            del _scoring_tasks[interview_id]
+
+    task.add_done_callback(_done)
+
+
+async def score_answer(interview_id: int, answer_seq: int):
+    """Score one answer against the question before it and store the result"""
+    db = SessionLocal()
+    try:
+        position = db.query(Interview.position).filter(Interview.id == interview_id).scalar()
+        rows = db.query(InterviewMessage.seq, InterviewMessage.role, InterviewMessage.content).filter(
+            InterviewMessage.interview_id == interview_id,
+            InterviewMessage.seq.in_([answer_seq - 1, answer_seq])
+        ).all()
+    finally:
+        db.close()
+
+    turns = {row.seq: row for row in rows}
+    answer = turns.get(answer_seq)
+    if answer is None or answer.role != "user":
+        return
+    question = turns.get(answer_seq - 1)
+
+    try:
+        score = await get_answer_scorer().score_answer_async(
+            position,
+            question.content if question is not None else "",
+            answer.content
+        )
+    except Exception as e:
+        print(f"[INTERVIEW] Scoring answer {answer_seq} of interview {interview_id} failed: {e}")
+        return
+
+    db = SessionLocal()
+    try:
+        db.add(InterviewAnswerScore(interview_id=interview_id, seq=answer_seq, **score))
+        db.commit()
+    except IntegrityError:
+        # Already scored by another run
+        db.rollback()
+    finally:
+        db.close()
+
+
+def load_answer_scores(db: Session, interview_id: int) -> List[Dict[str, Any]]:
+    """Stored per-answer scores in transcript order"""
+    rows = db.query(InterviewAnswerScore).filter(
+        InterviewAnswerScore.interview_id == interview_id
+    ).order_by(InterviewAnswerScore.seq).all()
+    return [
+        {"seq": row.seq, "note": row.note, **{d: getattr(row, d) for d in RUBRIC_DIMENSIONS}}
+        for row in rows
+    ]
+
+
+async def ensure_answer_scores(interview_id: int) -> List[Dict[str, Any]]:
+    """Wait for scoring in progress, score any answers still missing, and return all scores.
+
+    The final answer is always scored here, as are answers whose background
+    scoring failed or was lost in a restart.
+    """
+    in_flight = list(_scoring_tasks.get(interview_id, ()))
+    if in_flight:
+        await asyncio.gather(*in_flight, return_exceptions=True)
+
+    db = SessionLocal()
+    try:
+        answers = {seq for (seq,) in db.query(InterviewMessage.seq).filter(
+            InterviewMessage.interview_id == interview_id,
+            InterviewMessage.role == "user"
+        )}
+        scored = {seq for (seq,) in db.query(InterviewAnswerScore.seq).filter(
+            InterviewAnswerScore.interview_id == interview_id
+        )}
+    finally:
+        db.close()
+
+    missing = sorted(answers - scored)
+    if missing:
+        await asyncio.gather(*(score_answer(interview_id, seq) for seq in missing))
+
+    db = SessionLocal()
+    try:
+        return load_answer_scores(db, interview_id)
+    finally:
+        db.close()
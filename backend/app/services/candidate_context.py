@@ -0,0 +1,101 @@
+import re
+from typing import Any, Dict, List, Optional, Set
+
+from ..core.config import settings
+from ..models.user import User
+from .ai_service import CandidateProfile
+
+# CV text is split into chunks of about this size for the relevance excerpt
+EXCERPT_CHUNK_CHARS = 500
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+_STOPWORDS = {"and", "the", "for", "with", "our", "position", "interview", "company"}
+
+
+def _terms(text: str) -> Set[str]:
+    return {w for w in _WORD.findall(text.lower()) if len(w) > 2 and w not in _STOPWORDS}
+
+
+def _profile_from_info(user: User, info: Dict[str, Any]) -> CandidateProfile:
+    def records(key: str) -> List[Dict[str, Any]]:
+        return [item for item in info.get(key) or [] if isinstance(item, dict)]
+
+    try:
+        years = float(info.get("experience_years") or 0)
+    except (TypeError, ValueError):
+        years = 0.0
+
+    return CandidateProfile(
+        name=user.name,
+        email=user.email,
+        phone="",
+        current_position=str(info.get("current_position") or ""),
+        years_of_experience=years,
+        skills=[str(skill) for skill in info.get("skills") or []],
+        education=records("education"),
+        work_history=records("work_history")
+    )
+
+
+def _extra_info(info: Dict[str, Any]) -> str:
+    """Profile fields outside the extracted CV structure, e.g. text entered on the profile page"""
+    known = {"skills", "experience_years", "current_position", "education", "work_history"}
+    lines = [
+        f"- {key.replace('_', ' ').capitalize()}: {value}"
+        for key, value in info.items()
+        if key not in known and isinstance(value, (str, int, float)) and str(value).strip()
+    ]
+    return "\n\nAdditional Information:\n" + "\n".join(lines) if lines else ""
+
+
+def _chunks(text: str) -> List[str]:
+    chunks, current = [], ""
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if current and len(current) + len(line) + 1 > EXCERPT_CHUNK_CHARS:
+            chunks.append(current)
+            current = ""
+        current = f"{current}\n{line}" if current else line[:EXCERPT_CHUNK_CHARS]
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def cv_excerpt(cv_text: str, query: str, top_k: int) -> str:
+    """The top_k CV chunks sharing the most terms with the query, in CV order"""
+    chunks = _chunks(cv_text)
+    if len(chunks) <= top_k:
+        return "\n".join(chunks)
+
+    query_terms = _terms(query)
+    # Ties go to earlier chunks, which usually hold the headline and summary
+    ranked = sorted(range(len(chunks)), key=lambda i: (-len(_terms(chunks[i]) & query_terms), i))
+    return "\n...\n".join(chunks[i] for i in sorted(ranked[:top_k]))
+
+
+def build_candidate_context(user: User, job_position: str, job_description: str) -> str:
+    """Candidate section of the interviewer system prompt.
+
+    In "profile" mode this is the structured profile from User.info plus a
+    short excerpt of the CV most relevant to the job, capped at
+    INTERVIEW_CANDIDATE_CONTEXT_MAX_CHARS. "cv" mode, and users without an
+    extracted profile, get the raw CV text as before.
+    """
+    fallback = user.cv or f"Candidate: {user.name}\nEmail: {user.email}"
+    info: Optional[Dict[str, Any]] = user.info if isinstance(user.info, dict) else None
+    if settings.INTERVIEW_CANDIDATE_CONTEXT != "profile" or not info:
+        return fallback
+
+    max_chars = settings.INTERVIEW_CANDIDATE_CONTEXT_MAX_CHARS
+    context = (_profile_from_info(user, info).to_context().strip() + _extra_info(info))[:max_chars]
+
+    header = "\n\nCV Excerpt:\n"
+    remaining = max_chars - len(context) - len(header)
+    if user.cv and remaining > 0 and settings.INTERVIEW_CV_EXCERPT_CHUNKS > 0:
+        excerpt = cv_excerpt(user.cv, f"{job_position} {job_description}", settings.INTERVIEW_CV_EXCERPT_CHUNKS)
+        if excerpt:
+            context += header + excerpt[:remaining]
+
+    return context
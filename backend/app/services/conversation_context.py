@@ -0,0 +1,78 @@
+from typing import Any, Dict, List, Optional
+
+# Rough average for English text across common tokenizers; good enough for budgeting
+CHARS_PER_TOKEN = 4
+# Role and formatting tokens the chat template adds per message
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a piece of text"""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def estimate_messages_tokens(messages: List[Dict[str, str]]) -> int:
+    """Approximate prompt size of a chat completion request"""
+    return sum(estimate_tokens(m["content"]) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+class ConversationContext:
+    """Token-bounded view of an interview conversation sent to the model.
+
+    The system prompt and the last `recent_turns` exchanges are always sent
+    verbatim. Older messages are folded into a running summary; until the
+    summary catches up they are sent as-is, oldest dropped first when the
+    budget is exceeded.
+    """
+
+    def __init__(self, max_tokens: int, recent_turns: int):
+        self.max_tokens = max_tokens
+        self.recent_turns = recent_turns
+        self.summary: Optional[str] = None
+        self.summarized = 0  # history messages after the system prompt covered by the summary
+
+    def reset(self):
+        self.summary = None
+        self.summarized = 0
+
+    def _recent_start(self, history: List[Dict[str, str]]) -> int:
+        # An exchange is a candidate answer and the interviewer reply
+        return max(1, len(history) - 2 * self.recent_turns)
+
+    def pending(self, history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Messages older than the verbatim window that the summary does not cover yet"""
+        return history[1 + self.summarized:self._recent_start(history)]
+
+    def apply_summary(self, summary: str, covered: int):
+        self.summary = summary
+        self.summarized = covered
+
+    def build(self, history: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Messages for the next completion, within max_tokens where possible"""
+        start = self._recent_start(history)
+        head = history[:1]
+        if self.summary:
+            head = head + [{
+                "role": "system",
+                "content": f"Summary of the interview so far:\n{self.summary}"
+            }]
+        body = history[1 + self.summarized:start] + history[start:]
+
+        # Never drop the system prompt or the latest message
+        budget = self.max_tokens - estimate_messages_tokens(head)
+        sizes = [estimate_tokens(m["content"]) + MESSAGE_OVERHEAD_TOKENS for m in body]
+        total = sum(sizes)
+        dropped = 0
+        while total > budget and dropped < len(body) - 1:
+            total -= sizes[dropped]
+            dropped += 1
+
+        return head + body[dropped:]
+
+    def to_state(self) -> Dict[str, Any]:
+        return {"summary": self.summary, "summarized": self.summarized}
+
+    def load_state(self, state: Optional[Dict[str, Any]]):
+        if state:
+            self.summary = state.get("summary")
+            self.summarized = state.get("summarized", 0)
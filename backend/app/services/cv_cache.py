@@ -0,0 +1,127 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from datetime import datetime
+from typing import Optional, Tuple, Callable
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.cv_cache import CVExtractionCache
+from .ai_service import CandidateProfile
+
+
+class CVCache:
+    """Content-addressed cache of CV parsing and profile extraction results.
+
+    Entries are keyed by the SHA-256 of the uploaded bytes together with the
+    model name, prompt version and the CV_MAX_PAGES/CV_MAX_CHARS extraction
+    budgets, so changing any of them invalidates old results.
+    The database table is the shared tier; an optional in-process LRU sits in
+    front of it.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        memory_entries: int,
+        session_factory: Callable[[], Session] = SessionLocal
+    ):
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._session_factory = session_factory
+        self._memory: "OrderedDict[str, Tuple[str, CandidateProfile]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(content_sha256: str, model: str, prompt_version: str) -> str:
+        # The budgets decide how much of the CV was parsed and sent to the model
+        budgets = f"{settings.CV_MAX_PAGES}:{settings.CV_MAX_CHARS}"
+        return hashlib.sha256(f"{content_sha256}:{model}:{prompt_version}:{budgets}".encode("utf-8")).hexdigest()
+
+    def _remember(self, key: str, value: Tuple[str, CandidateProfile]):
+        if self.memory_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def get(self, content_sha256: str, model: str, prompt_version: str) -> Optional[Tuple[str, CandidateProfile]]:
+        """Return (cv_text, profile) for a previously processed upload"""
+        key = self.make_key(content_sha256, model, prompt_version)
+
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                self._memory.move_to_end(key)
+                return cached
+
+        db = self._session_factory()
+        try:
+            row = db.query(CVExtractionCache).filter(CVExtractionCache.cache_key == key).first()
+            if row is None:
+                return None
+            row.hit_count = (row.hit_count or 0) + 1
+            row.last_used_at = datetime.utcnow()
+            db.commit()
+            value = (row.cv_text, CandidateProfile(**json.loads(row.profile)))
+        finally:
+            db.close()
+
+        self._remember(key, value)
+        return value
+
+    def put(self, content_sha256: str, model: str, prompt_version: str, cv_text: str, profile: CandidateProfile):
+        key = self.make_key(content_sha256, model, prompt_version)
+
+        db = self._session_factory()
+        try:
+            db.merge(CVExtractionCache(
+                cache_key=key,
+                content_sha256=content_sha256,
+                model=model,
+                prompt_version=prompt_version,
+                cv_text=cv_text,
+                profile=json.dumps(asdict(profile)),
+                hit_count=0,
+                last_used_at=datetime.utcnow()
+            ))
+            db.commit()
+            self._evict(db)
+        finally:
+            db.close()
+
+        self._remember(key, (cv_text, profile))
+
+    def _evict(self, db: Session):
+        """Drop least recently used rows beyond max_entries"""
+        overflow = db.query(CVExtractionCache).count() - self.max_entries
+        if overflow <= 0:
+            return
+        stale_keys = [
+            key for (key,) in db.query(CVExtractionCache.cache_key)
+            .order_by(CVExtractionCache.last_used_at.asc())
+            .limit(overflow)
+        ]
+        db.query(CVExtractionCache).filter(
+            CVExtractionCache.cache_key.in_(stale_keys)
+        ).delete(synchronize_session=False)
+        db.commit()
+
+
+_cv_cache: Optional[CVCache] = None
+
+
+def get_cv_cache() -> CVCache:
+    global _cv_cache
+    if _cv_cache is None:
+        _cv_cache = CVCache(
+            max_entries=settings.CV_CACHE_MAX_ENTRIES,
+            memory_entries=settings.CV_CACHE_MEMORY_ENTRIES
+        )
+    return _cv_cache
@@ -0,0 +1,337 @@
+import asyncio
+import hashlib
+import os
+import secrets
+import time
+import uuid
+import zipfile
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..core.security import get_password_hash
+from ..models.cv_import import CVImportRun, CVImportFile
+from ..models.user import User, Role
+from .cv_ingestion import apply_cv_to_user, process_cv
+from .heartbeat import run_every, stale_cutoff
+from .llm_scheduler import Priority
+
+IMPORT_EXTENSIONS = ('.pdf', '.docx', '.doc', '.txt')
+
+
+# Error stored on runs left "running" by a process that went away
+INTERRUPTED_ERROR = "Import was interrupted by a server restart, upload the archive again to resume"
+
+
+def _too_large(size: int) -> Optional[str]:
+    max_bytes = settings.CV_MAX_UPLOAD_BYTES
+    if size > max_bytes:
+        return f"CV exceeds the {max_bytes // (1024 * 1024)} MB upload limit"
+    return None
+
+
+def iter_cv_files(path: str) -> Iterator[Tuple[str, bytes, Optional[str]]]:
+    """Yield (name, content, error) for every CV in a directory tree or ZIP archive.
+
+    Files over CV_MAX_UPLOAD_BYTES are never read; they are yielded with
+    empty content and an error so the import records them as failed.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.is_dir() or not info.filename.lower().endswith(IMPORT_EXTENSIONS):
+                    continue
+                # Reads stop at the declared size, so a lying header cannot inflate past it
+                error = _too_large(info.file_size)
+                yield info.filename, b"" if error else archive.read(info), error
+        return
+
+    for root, _, filenames in os.walk(path):
+        for filename in sorted(filenames):
+            if filename.lower().endswith(IMPORT_EXTENSIONS):
+                file_path = os.path.join(root, filename)
+                name = os.path.relpath(file_path, path)
+                error = _too_large(os.path.getsize(file_path))
+                if error:
+                    yield name, b"", error
+                    continue
+                with open(file_path, 'rb') as f:
+                    yield name, f.read(), None
+
+
+@dataclass
+class ImportReport:
+    run_id: str
+    imported: int = 0
+    updated: int = 0
+    skipped: int = 0
+    failed: int = 0
+    elapsed_seconds: float = 0.0
+    files: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def processed(self) -> int:
+        return self.imported + self.updated + self.failed
+
+    @property
+    def cvs_per_minute(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.processed / self.elapsed_seconds * 60
+
+
+def create_import_run(created_by: Optional[int] = None) -> str:
+    run_id = str(uuid.uuid4())
+    db = SessionLocal()
+    try:
+        db.add(CVImportRun(id=run_id, created_by=created_by, status="running", heartbeat_at=datetime.utcnow()))
+        db.commit()
+    finally:
+        db.close()
+    return run_id
+
+
+def _touch_run(run_id: str):
+    db = SessionLocal()
+    try:
+        db.query(CVImportRun).filter(
+            CVImportRun.id == run_id,
+            CVImportRun.status == "running"
+        ).update({"heartbeat_at": datetime.utcnow()}, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def fail_stale_import_runs(run_ids: Optional[Iterable[str]] = None):
+    """Fail runs left "running" by a process that crashed or was killed (optionally only `run_ids`).
+
+    import_cvs touches heartbeat_at every CV_IMPORT_HEARTBEAT_SECONDS, so a
+    run not touched within CV_IMPORT_STALE_SECONDS has lost its process.
+    """
+    db = SessionLocal()
+    try:
+        query = db.query(CVImportRun).filter(
+            CVImportRun.status == "running",
+            func.coalesce(CVImportRun.heartbeat_at, CVImportRun.started_at)
+            < stale_cutoff(settings.CV_IMPORT_STALE_SECONDS)
+        )
+        if run_ids is not None:
+            query = query.filter(CVImportRun.id.in_(list(run_ids)))
+        failed = query.update({
+            "status": "failed",
+            "error": INTERRUPTED_ERROR,
+            "finished_at": datetime.utcnow()
+        }, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+    if failed:
+        print(f"[CV IMPORT] Failed {failed} stale import run(s)")
+
+
+def _read_next(files: Iterator[Tuple[str, bytes, Optional[str]]]) -> Optional[Tuple[str, str, bytes, Optional[str]]]:
+    """Read and hash the next file as (name, sha256, content, error), or None when done.
+
+    Runs in a worker thread: decompressing a ZIP member and hashing it would
+    otherwise stall the event loop for every file.
+    """
+    item = next(files, None)
+    if item is None:
+        return None
+    filename, content, error = item
+    return filename, hashlib.sha256(content).hexdigest(), content, error
+
+
+def _already_imported(content_sha256: str) -> bool:
+    db = SessionLocal()
+    try:
+        return db.query(CVImportFile.id).filter(
+            CVImportFile.content_sha256 == content_sha256,
+            CVImportFile.status != "failed"
+        ).first() is not None
+    finally:
+        db.close()
+
+
+def _write_batch(run_id: str, results: list, skipped: List[Tuple[str, str]], report: ImportReport):
+    """Create or update candidates for one batch and record per-file outcomes in one commit"""
+    db = SessionLocal()
+    try:
+        emails = {
+            profile.email.strip().lower()
+            for _, _, _, profile, _ in results
+            if profile and profile.email
+        }
+        users = {
+            user.email.lower(): user
+            for user in db.query(User).filter(User.email.in_(emails))
+        } if emails else {}
+
+        file_rows = [
+            (filename, content_sha256, "skipped", None, None)
+            for filename, content_sha256 in skipped
+        ]
+        for filename, content_sha256, cv_text, profile, error in results:
+            email = profile.email.strip().lower() if profile and profile.email else ""
+            if error is None and not email:
+                error = "No email address found in CV"
+
+            user = users.get(email) if error is None else None
+            if error is None and user is not None and user.role != Role.CANDIDATE.value:
+                error = f"{email} belongs to a non-candidate account"
+
+            if error is not None:
+                outcome = "failed"
+            elif user is not None:
+                outcome = "updated"
+            else:
+                outcome = "imported"
+                user = User(
+                    name=profile.name or email,
+                    email=email,
+                    # Imported candidates have no usable password until they reset it
+                    password=get_password_hash(secrets.token_urlsafe(32)),
+                    role=Role.CANDIDATE.value
+                )
+                db.add(user)
+                users[email] = user
+
+            if user is not None and outcome != "failed":
+                apply_cv_to_user(user, cv_text, profile)
+
+            file_rows.append((filename, content_sha256, outcome, user if outcome != "failed" else None, error))
+
+        # Assign ids to new users before linking the file rows
+        db.flush()
+        db.add_all([
+            CVImportFile(
+                run_id=run_id,
+                filename=filename,
+                content_sha256=content_sha256,
+                status=outcome,
+                user_id=user.id if user is not None else None,
+                error=error
+            )
+            for filename, content_sha256, outcome, user, error in file_rows
+        ])
+
+        for filename, _, outcome, user, error in file_rows:
+            setattr(report, outcome, getattr(report, outcome) + 1)
+            report.files.append({
+                "filename": filename,
+                "status": outcome,
+                "user_id": user.id if user is not None else None,
+                "error": error
+            })
+
+        db.query(CVImportRun).filter(CVImportRun.id == run_id).update({
+            "imported": report.imported,
+            "updated": report.updated,
+            "skipped": report.skipped,
+            "failed": report.failed
+        })
+        db.commit()
+    finally:
+        db.close()
+
+
+async def import_cvs(
+    files: Iterable[Tuple[str, bytes, Optional[str]]],
+    run_id: str,
+    concurrency: int,
+    batch_size: int
+) -> ImportReport:
+    """Import CVs with at most `concurrency` extractions in flight.
+
+    Files are read and hashed off the event loop only as extraction slots
+    free up, so no more than `concurrency` of them are held in memory.
+    Outcomes are committed every `batch_size` files, and files whose content
+    was already imported by any earlier run are skipped, so an interrupted
+    import can be restarted with the same input. Files yielded with an error
+    are recorded as failed without being extracted.
+    """
+    report = ImportReport(run_id=run_id)
+    slots = asyncio.Semaphore(concurrency)
+    extractions: Set[asyncio.Task] = set()
+    results: list = []  # (filename, content_sha256, cv_text, profile, error) not yet written
+    skipped: List[Tuple[str, str]] = []
+    claimed: Set[str] = set()  # hashes already imported or being imported by this run
+    started = time.monotonic()
+
+    async def extract(filename: str, content_sha256: str, content: bytes):
+        try:
+            cv_text, profile = await process_cv(content, filename, content_sha256, Priority.BATCH)
+            results.append((filename, content_sha256, cv_text, profile, None))
+        except Exception as e:
+            results.append((filename, content_sha256, None, None, str(e)))
+        finally:
+            slots.release()
+
+    async def flush():
+        written, written_skipped = results[:], skipped[:]
+        results.clear()
+        skipped.clear()
+        await asyncio.to_thread(_write_batch, run_id, written, written_skipped, report)
+
+    heartbeat = asyncio.create_task(run_every(
+        settings.CV_IMPORT_HEARTBEAT_SECONDS,
+        lambda: asyncio.to_thread(_touch_run, run_id),
+        "CV IMPORT"
+    ))
+    status, error = "failed", "Import interrupted"
+    try:
+        files = iter(files)
+        while True:
+            await slots.acquire()
+            item = await asyncio.to_thread(_read_next, files)
+            if item is None:
+                slots.release()
+                break
+
+            filename, content_sha256, content, file_error = item
+            if file_error:
+                slots.release()
+                results.append((filename, content_sha256, None, None, file_error))
+            elif content_sha256 in claimed or await asyncio.to_thread(_already_imported, content_sha256):
+                slots.release()
+                skipped.append((filename, content_sha256))
+            else:
+                # Identical files within a run are only imported once
+                claimed.add(content_sha256)
+                task = asyncio.create_task(extract(filename, content_sha256, content))
+                extractions.add(task)
+                task.add_done_callback(extractions.discard)
+
+            if len(results) + len(skipped) >= batch_size:
+                await flush()
+
+        await asyncio.gather(*extractions)
+        if results or skipped:
+            await flush()
+        status, error = "completed", None
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        heartbeat.cancel()
+        for task in extractions:
+            task.cancel()
+        report.elapsed_seconds = time.monotonic() - started
+        db = SessionLocal()
+        try:
+            db.query(CVImportRun).filter(CVImportRun.id == run_id).update({
+                "status": status,
+                "error": error,
+                "finished_at": datetime.utcnow(),
+                "heartbeat_at": None
+            })
+            db.commit()
+        finally:
+            db.close()
+
+    return report
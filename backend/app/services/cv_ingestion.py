@@ -0,0 +1,234 @@
+import asyncio
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.cv_ingestion_job import CVIngestionJob
+from ..models.user import User
+from .ai_service import CandidateProfile, PROFILE_PROMPT_VERSION, get_ai_service
+from .cv_cache import get_cv_cache
+from .cv_parser import SpooledUpload
+from .heartbeat import run_every, stale_cutoff
+from .llm_scheduler import Priority
+
+
+async def _extract_cached(
+    content_sha256: str,
+    read_text: Callable[[], Awaitable[str]],
+    priority: Priority = Priority.CV_EXTRACTION
+) -> Tuple[str, CandidateProfile]:
+    ai_service = get_ai_service()
+    cv_cache = get_cv_cache()
+
+    cached = cv_cache.get(content_sha256, ai_service.model, PROFILE_PROMPT_VERSION)
+    if cached:
+        return cached
+
+    cv_text = await read_text()
+    profile = await ai_service.extract_profile_async(cv_text, priority)
+    cv_cache.put(content_sha256, ai_service.model, PROFILE_PROMPT_VERSION, cv_text, profile)
+    return cv_text, profile
+
+
+async def process_cv(
+    content: bytes,
+    filename: str,
+    content_sha256: Optional[str] = None,
+    priority: Priority = Priority.CV_EXTRACTION
+) -> Tuple[str, CandidateProfile]:
+    """Parse a CV and extract the profile, reusing earlier results for identical uploads"""
+    return await _extract_cached(
+        content_sha256 or hashlib.sha256(content).hexdigest(),
+        lambda: get_ai_service().read_cv_async(content, filename),
+        priority
+    )
+
+
+async def process_cv_file(path: str, filename: str, content_sha256: str) -> Tuple[str, CandidateProfile]:
+    """Same as process_cv for an upload spooled to disk"""
+    return await _extract_cached(
+        content_sha256,
+        lambda: get_ai_service().read_cv_file_async(path, filename)
+    )
+
+
+def apply_cv_to_user(user: User, cv_text: str, profile: CandidateProfile):
+    """Copy parsed CV data onto the user row (caller commits)"""
+    user.cv = cv_text
+    user.info = {
+        "skills": profile.skills,
+        "experience_years": profile.years_of_experience,
+        "current_position": profile.current_position,
+        "education": profile.education,
+        "work_history": profile.work_history
+    }
+
+
+def profile_summary(profile: CandidateProfile) -> Dict[str, Any]:
+    return {
+        "name": profile.name,
+        "current_position": profile.current_position,
+        "years_of_experience": profile.years_of_experience,
+        "skills": profile.skills[:10],  # Return top 10 skills
+        "education_count": len(profile.education),
+        "work_history_count": len(profile.work_history)
+    }
+
+
+class IngestionQueueFullError(Exception):
+    """Raised when the ingestion queue cannot accept more uploads"""
+
+
+# Error stored on jobs whose spooled upload was lost to a shutdown or crash
+INTERRUPTED_ERROR = "Processing was interrupted by a server restart, please upload the CV again"
+
+
+class CVIngestionQueue:
+    """Bounded in-process queue of CV uploads drained by a fixed set of workers.
+
+    Job state lives in the cv_ingestion_jobs table so any replica can report
+    progress; the spooled upload only lives on the accepting worker's disk.
+    The queue touches updated_at of its jobs every CV_INGESTION_HEARTBEAT_SECONDS
+    and fails any job whose heartbeat is older than CV_INGESTION_STALE_SECONDS,
+    so jobs of a crashed worker are failed even if it restarts right away.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._active: Set[str] = set()  # queued or processing here
+
+    def start(self):
+        self.fail_stale_jobs()
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        self._tasks.append(asyncio.create_task(run_every(
+            settings.CV_INGESTION_HEARTBEAT_SECONDS,
+            lambda: asyncio.to_thread(self._heartbeat),
+            "CV"
+        )))
+
+    async def stop(self):
+        """Cancel the workers, then fail queued jobs and delete their spooled files"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        while self._queue is not None and not self._queue.empty():
+            job_id, _, upload, _ = self._queue.get_nowait()
+            self._set_status(job_id, "failed", error=INTERRUPTED_ERROR)
+            self._active.discard(job_id)
+            os.remove(upload.path)
+            self._queue.task_done()
+
+    def _heartbeat(self):
+        """Mark this worker's jobs alive, then fail everyone's stale ones"""
+        active = list(self._active)
+        if active:
+            db = SessionLocal()
+            try:
+                db.query(CVIngestionJob).filter(
+                    CVIngestionJob.id.in_(active),
+                    CVIngestionJob.status.in_(("queued", "processing"))
+                ).update({"updated_at": datetime.utcnow()}, synchronize_session=False)
+                db.commit()
+            finally:
+                db.close()
+        self.fail_stale_jobs()
+
+    @staticmethod
+    def fail_stale_jobs(job_ids: Optional[Iterable[str]] = None):
+        """Fail queued or processing jobs whose heartbeat stopped (optionally only `job_ids`)"""
+        db = SessionLocal()
+        try:
+            query = db.query(CVIngestionJob).filter(
+                CVIngestionJob.status.in_(("queued", "processing")),
+                CVIngestionJob.updated_at < stale_cutoff(settings.CV_INGESTION_STALE_SECONDS)
+            )
+            if job_ids is not None:
+                query = query.filter(CVIngestionJob.id.in_(list(job_ids)))
+            failed = query.update({"status": "failed", "error": INTERRUPTED_ERROR}, synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+        if failed:
+            print(f"[CV] Failed {failed} stale ingestion job(s)")
+
+    def submit(self, user_id: int, upload: SpooledUpload, filename: str) -> str:
+        """Record a queued job and hand the spooled upload to the workers.
+
+        The queue takes ownership of the spooled file once this returns.
+        """
+        if self._queue is None or self._queue.full():
+            raise IngestionQueueFullError("CV processing queue is full, please retry shortly")
+
+        job_id = str(uuid.uuid4())
+        db = SessionLocal()
+        try:
+            db.add(CVIngestionJob(id=job_id, user_id=user_id, filename=filename, status="queued"))
+            db.commit()
+        finally:
+            db.close()
+
+        self._active.add(job_id)
+        self._queue.put_nowait((job_id, user_id, upload, filename))
+        return job_id
+
+    def _set_status(self, job_id: str, status: str, **fields):
+        db = SessionLocal()
+        try:
+            db.query(CVIngestionJob).filter(CVIngestionJob.id == job_id).update(
+                {"status": status, **fields}
+            )
+            db.commit()
+        finally:
+            db.close()
+
+    async def _worker(self):
+        while True:
+            job_id, user_id, upload, filename = await self._queue.get()
+            try:
+                self._set_status(job_id, "processing")
+                cv_text, profile = await process_cv_file(upload.path, filename, upload.content_sha256)
+
+                db = SessionLocal()
+                try:
+                    user = db.query(User).filter(User.id == user_id).first()
+                    apply_cv_to_user(user, cv_text, profile)
+                    db.query(CVIngestionJob).filter(CVIngestionJob.id == job_id).update({
+                        "status": "completed",
+                        "result": json.dumps(profile_summary(profile))
+                    })
+                    db.commit()
+                finally:
+                    db.close()
+            except asyncio.CancelledError:
+                self._set_status(job_id, "failed", error=INTERRUPTED_ERROR)
+                raise
+            except Exception as e:
+                self._set_status(job_id, "failed", error=str(e))
+            finally:
+                self._active.discard(job_id)
+                os.remove(upload.path)
+                self._queue.task_done()
+
+
+_ingestion_queue: Optional[CVIngestionQueue] = None
+
+
+def get_ingestion_queue() -> CVIngestionQueue:
+    global _ingestion_queue
+    if _ingestion_queue is None:
+        _ingestion_queue = CVIngestionQueue(
+            workers=settings.CV_INGESTION_WORKERS,
+            max_pending=settings.CV_INGESTION_QUEUE_SIZE
+        )
+    return _ingestion_queue
@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import mmap
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Iterable, Iterator, List, Optional
+
+import PyPDF2
+import docx
+
+from ..core.config import settings
+
+
+class CVParseTimeoutError(Exception):
+    """Raised when a document takes longer than CV_PARSE_TIMEOUT_SECONDS to parse"""
+
+
+class CVTooLargeError(Exception):
+    """Raised when an upload exceeds CV_MAX_UPLOAD_BYTES"""
+
+
+@dataclass
+class SpooledUpload:
+    path: str
+    content_sha256: str
+    size: int
+
+
+async def spool_upload(upload, max_bytes: int, chunk_size: int = 1024 * 1024) -> SpooledUpload:
+    """Copy an async-readable upload to a temp file, hashing it on the way.
+
+    Memory use is bounded by chunk_size regardless of the upload size. The
+    caller owns the returned file and must remove it.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    spool = tempfile.NamedTemporaryFile(prefix="cv-", delete=False)
+    try:
+        with spool:
+            while True:
+                chunk = await upload.read(chunk_size)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > max_bytes:
+                    raise CVTooLargeError(f"CV exceeds the {max_bytes // (1024 * 1024)} MB upload limit")
+                digest.update(chunk)
+                spool.write(chunk)
+    except BaseException:
+        os.remove(spool.name)
+        raise
+    return SpooledUpload(path=spool.name, content_sha256=digest.hexdigest(), size=size)
+
+
+def _take_budget(chunks: Iterable[str], max_chars: int) -> str:
+    """Join chunks once, stopping as soon as max_chars have been collected"""
+    parts: List[str] = []
+    remaining = max_chars
+    for chunk in chunks:
+        if not chunk:
+            continue
+        parts.append(chunk[:remaining])
+        remaining -= len(parts[-1])
+        if remaining <= 0:
+            break
+    return ''.join(parts)
+
+
+def iter_pdf_pages(stream, max_pages: int) -> Iterator[str]:
+    """Lazily extract text page by page, up to max_pages"""
+    pdf_reader = PyPDF2.PdfReader(stream)
+    for index, page in enumerate(pdf_reader.pages):
+        if index >= max_pages:
+            break
+        yield page.extract_text() or ""
+
+
+def read_pdf(file_content: bytes, max_pages: int = None, max_chars: int = None) -> str:
+    """Extract text from PDF file content"""
+    return _take_budget(
+        iter_pdf_pages(BytesIO(file_content), max_pages or settings.CV_MAX_PAGES),
+        max_chars or settings.CV_MAX_CHARS
+    )
+
+
+def read_pdf_file(path: str, max_pages: int = None, max_chars: int = None) -> str:
+    """Extract text from a PDF on disk through a read-only memory map"""
+    if os.path.getsize(path) == 0:
+        return ""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return _take_budget(
+            iter_pdf_pages(mapped, max_pages or settings.CV_MAX_PAGES),
+            max_chars or settings.CV_MAX_CHARS
+        )
+
+
+def read_docx(file_content, max_chars: int = None) -> str:
+    """Extract text from DOCX file content (bytes or a path)"""
+    source = BytesIO(file_content) if isinstance(file_content, bytes) else file_content
+    doc = docx.Document(source)
+    return _take_budget(
+        (paragraph.text + '\n' for paragraph in doc.paragraphs),
+        max_chars or settings.CV_MAX_CHARS
+    ).rstrip('\n')
+
+
+def parse_cv(file_content: bytes, filename: str, max_pages: int = None, max_chars: int = None) -> str:
+    """Read CV content based on file extension"""
+    ext = os.path.splitext(filename)[1].lower()
+    max_chars = max_chars or settings.CV_MAX_CHARS
+    if ext == '.pdf':
+        return read_pdf(file_content, max_pages, max_chars)
+    elif ext in ['.docx', '.doc']:
+        return read_docx(file_content, max_chars)
+    elif ext == '.txt':
+        return file_content.decode('utf-8')[:max_chars]
+    else:
+        raise ValueError(f"Unsupported file format: {ext}")
+
+
+def parse_cv_file(path: str, filename: str, max_pages: int = None, max_chars: int = None) -> str:
+    """Read a CV spooled to disk, without loading the whole file into memory"""
+    ext = os.path.splitext(filename)[1].lower()
+    max_chars = max_chars or settings.CV_MAX_CHARS
+    if ext == '.pdf':
+        return read_pdf_file(path, max_pages, max_chars)
+    elif ext in ['.docx', '.doc']:
+        return read_docx(path, max_chars)
+    elif ext == '.txt':
+        with open(path, encoding='utf-8') as f:
+            return f.read(max_chars)
+    else:
+        raise ValueError(f"Unsupported file format: {ext}")
+
+
+# Document parsing is CPU-bound and holds the GIL, so it runs in worker
+# processes rather than threads. Workers are spawned (not forked) so they do
+# not inherit the parent's database connections or event loop.
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_slots: Optional[asyncio.Semaphore] = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    with _pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(
+                max_workers=settings.CV_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _parse_pool
+
+
+def shutdown_parse_pool(kill: bool = False, pool: Optional[ProcessPoolExecutor] = None):
+    """Stop the worker pool. With kill=True, running parses are terminated.
+
+    Given a `pool`, nothing happens if it has already been replaced.
+    """
+    global _parse_pool
+    with _pool_lock:
+        if pool is not None and pool is not _parse_pool:
+            return
+        pool, _parse_pool = _parse_pool, None
+    if pool is None:
+        return
+    if kill:
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+    pool.shutdown(wait=not kill, cancel_futures=kill)
+
+
+async def _run_in_pool(label: str, func, *args) -> str:
+    """Run a parse function in the process pool without blocking the event loop.
+
+    At most CV_PARSE_WORKERS documents are in flight, so the timeout measures
+    parse time rather than time spent queueing. A document that exceeds it
+    gets its worker process killed and the pool is recreated on next use.
+    Other parses running in that pool see it break and are retried once on
+    the new one.
+    """
+    global _parse_slots
+    if _parse_slots is None:
+        _parse_slots = asyncio.Semaphore(settings.CV_PARSE_WORKERS)
+
+    async with _parse_slots:
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = get_parse_pool()
+            future = loop.run_in_executor(pool, func, *args)
+            try:
+                return await asyncio.wait_for(future, timeout=settings.CV_PARSE_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                shutdown_parse_pool(kill=True, pool=pool)
+                raise CVParseTimeoutError(
+                    f"Parsing {label} took longer than {settings.CV_PARSE_TIMEOUT_SECONDS} seconds"
+                )
+            except BrokenProcessPool:
+                # Killed for another document's timeout, or a worker crashed
+                shutdown_parse_pool(kill=True, pool=pool)
+                if attempt:
+                    raise
+                print(f"[CV] Parse pool broke while parsing {label}, retrying on a new pool")
+
+
+async def parse_cv_async(file_content: bytes, filename: str) -> str:
+    """Parse CV bytes in the process pool"""
+    return await _run_in_pool(
+        filename, parse_cv, file_content, filename, settings.CV_MAX_PAGES, settings.CV_MAX_CHARS
+    )
+
+
+async def parse_cv_file_async(path: str, filename: str) -> str:
+    """Parse a spooled CV in the process pool; only the path crosses the process boundary"""
+    return await _run_in_pool(
+        filename, parse_cv_file, path, filename, settings.CV_MAX_PAGES, settings.CV_MAX_CHARS
+    )
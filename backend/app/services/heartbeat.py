@@ -0,0 +1,24 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable
+
+
+def stale_cutoff(stale_seconds: float) -> datetime:
+    """Heartbeats older than this belong to a process that has gone away"""
+    return datetime.utcnow() - timedelta(seconds=stale_seconds)
+
+
+async def run_every(interval_seconds: float, job: Callable[[], Awaitable[Any]], label: str):
+    """Await `job` every interval until cancelled, logging failures.
+
+    Background work recorded in the database is kept alive by touching a
+    heartbeat column this way; any worker's sweep fails or resumes rows whose
+    heartbeat stopped, so a crash is noticed within the stale window instead
+    of only at the next startup.
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await job()
+        except Exception as e:
+            print(f"[{label}] Periodic task failed: {e}")
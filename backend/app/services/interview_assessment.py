@@ -0,0 +1,219 @@
+import asyncio
+import random
+from datetime import datetime
+from typing import Optional, Set
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.interview import Interview
+from ..models.user import User
+from .ai_service import InterviewSimulator, remove_interview_session
+from .answer_scoring import ensure_answer_scores, get_answer_scorer, incremental_scoring_enabled
+from .heartbeat import run_every, stale_cutoff
+from .interview_preparation import initialize_for_interview
+from .interview_transcript import iter_transcript
+from .recruiter_stats import invalidate_recruiter_stats
+
+# Keep references so running assessments are not garbage collected
+_assessment_tasks: Set[asyncio.Task] = set()
+
+
+def begin_assessment(db: Session, interview: Interview, session: InterviewSimulator):
+    """Mark a finished interview as "assessing" and score it in the background.
+
+    The candidate gets the closing message without also waiting for the
+    assessment call; recruiters see "assessing" until the score is stored.
+    """
+    interview.status = "assessing"
+    interview.completed_at = datetime.utcnow()
+    interview.assessment_heartbeat_at = datetime.utcnow()
+    db.commit()
+    invalidate_recruiter_stats()
+    _schedule(interview.id, session, claimed=True)
+
+
+def retry_assessment(db: Session, interview: Interview):
+    """Run the assessment again for an interview marked assessment_failed"""
+    interview.status = "assessing"
+    interview.assessment_heartbeat_at = datetime.utcnow()
+    db.commit()
+    invalidate_recruiter_stats()
+    _schedule(interview.id, claimed=True)
+
+
+def _schedule(interview_id: int, session: Optional[InterviewSimulator] = None, claimed: bool = False):
+    task = asyncio.create_task(run_assessment(interview_id, session, claimed))
+    _assessment_tasks.add(task)
+    task.add_done_callback(_assessment_tasks.discard)
+
+
+def _claim(interview_id: int) -> bool:
+    """Take over an assessment whose heartbeat stopped; False if a live worker holds it"""
+    db = SessionLocal()
+    try:
+        claimed = db.query(Interview).filter(
+            Interview.id == interview_id,
+            Interview.status == "assessing",
+            or_(
+                Interview.assessment_heartbeat_at.is_(None),
+                Interview.assessment_heartbeat_at < stale_cutoff(settings.INTERVIEW_ASSESSMENT_STALE_SECONDS)
+            )
+        ).update({Interview.assessment_heartbeat_at: datetime.utcnow()}, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+    return claimed == 1
+
+
+def _touch(interview_id: int):
+    db = SessionLocal()
+    try:
+        db.query(Interview).filter(
+            Interview.id == interview_id,
+            Interview.status == "assessing"
+        ).update({Interview.assessment_heartbeat_at: datetime.utcnow()}, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+
+def _rebuild_session(db: Session, interview: Interview) -> InterviewSimulator:
+    user = db.query(User).filter(User.id == interview.user_id).first()
+    session = InterviewSimulator()
+    initialize_for_interview(session, interview, user)
+    session.restore_turns(iter_transcript(db, interview.id))
+    return session
+
+
+async def run_assessment(
+    interview_id: int,
+    session: Optional[InterviewSimulator] = None,
+    claimed: bool = False
+):
+    """Generate the final assessment and complete the interview.
+
+    In incremental mode the stored per-answer scores are averaged and only
+    a short summary is generated; otherwise (or when no answer could be
+    scored) the whole transcript is assessed in one call. Without a live
+    session it is rebuilt from the persisted transcript. Failures are
+    retried with backoff; after INTERVIEW_ASSESSMENT_ATTEMPTS the interview
+    is marked "assessment_failed" so clients stop waiting and can retry.
+
+    Unless the caller already `claimed` it, the assessment is only run when
+    no other worker is heartbeating it, and the heartbeat is kept up while
+    it runs.
+    """
+    if not claimed and not await asyncio.to_thread(_claim, interview_id):
+        return
+
+    keepalive = asyncio.create_task(run_every(
+        settings.INTERVIEW_ASSESSMENT_HEARTBEAT_SECONDS,
+        lambda: asyncio.to_thread(_touch, interview_id),
+        "INTERVIEW"
+    ))
+    try:
+        await _assess(interview_id, session)
+    finally:
+        keepalive.cancel()
+
+
+async def _assess(interview_id: int, session: Optional[InterviewSimulator]):
+    db = SessionLocal()
+    try:
+        interview = db.query(Interview).filter(
+            Interview.id == interview_id,
+            Interview.status == "assessing"
+        ).first()
+        if interview is None:
+            return
+        position = interview.position
+        if session is None:
+            session = _rebuild_session(db, interview)
+    finally:
+        db.close()
+
+    attempts = max(1, settings.INTERVIEW_ASSESSMENT_ATTEMPTS)
+    for attempt in range(1, attempts + 1):
+        try:
+            assessment = await _generate(interview_id, position, session)
+            break
+        except Exception as e:
+            print(f"[INTERVIEW] Assessment for {interview_id} failed (attempt {attempt}/{attempts}): {e}")
+            if attempt == attempts:
+                _mark_failed(interview_id)
+                return
+            delay = settings.INTERVIEW_ASSESSMENT_RETRY_DELAY_SECONDS * 2 ** (attempt - 1)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+    db = SessionLocal()
+    try:
+        # Guarded by status so a duplicate run does not overwrite a stored result
+        db.query(Interview).filter(
+            Interview.id == interview_id,
+            Interview.status == "assessing"
+        ).update({
+            Interview.status: "completed",
+            Interview.score: assessment.get("overall_score", 0),
+            Interview.assessment: assessment,
+            Interview.assessment_heartbeat_at: None
+        }, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+    invalidate_recruiter_stats()
+    await asyncio.to_thread(remove_interview_session, interview_id)
+
+
+async def _generate(interview_id: int, position: str, session: InterviewSimulator) -> dict:
+    if incremental_scoring_enabled():
+        answer_scores = await ensure_answer_scores(interview_id)
+        if answer_scores:
+            return await get_answer_scorer().aggregate_async(position, answer_scores)
+    return await session.generate_assessment_async()
+
+
+def _mark_failed(interview_id: int):
+    db = SessionLocal()
+    try:
+        db.query(Interview).filter(
+            Interview.id == interview_id,
+            Interview.status == "assessing"
+        ).update({
+            Interview.status: "assessment_failed",
+            Interview.assessment_heartbeat_at: None
+        }, synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+    invalidate_recruiter_stats()
+
+
+def _stale_assessments():
+    db = SessionLocal()
+    try:
+        return [row.id for row in db.query(Interview.id).filter(
+            Interview.status == "assessing",
+            or_(
+                Interview.assessment_heartbeat_at.is_(None),
+                Interview.assessment_heartbeat_at < stale_cutoff(settings.INTERVIEW_ASSESSMENT_STALE_SECONDS)
+            )
+        )]
+    finally:
+        db.close()
+
+
+async def resume_assessments():
+    """Reschedule assessments whose worker stopped heartbeating (crash, restart or deploy).
+
+    Run at startup and every INTERVIEW_ASSESSMENT_HEARTBEAT_SECONDS; each
+    assessment is claimed before it runs, so only one worker takes it over.
+    """
+    pending = await asyncio.to_thread(_stale_assessments)
+    if pending:
+        print(f"[INTERVIEW] Resuming {len(pending)} interrupted assessment(s)")
+    for interview_id in pending:
+        _schedule(interview_id)
@@ -0,0 +1,68 @@
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..core.database import SessionLocal
+from ..models.interview import Interview
+from ..models.user import User
+from .ai_service import InterviewSimulator
+from .candidate_context import build_candidate_context
+from .interview_transcript import record_prepared_opening, transcript_length
+from .llm_scheduler import Priority
+
+
+def initialize_for_interview(session: InterviewSimulator, interview: Interview, user: User):
+    """Seed a simulator with the candidate's profile and the interview's job details"""
+    job_description = f"Interview for {interview.position} position at {interview.company or 'our company'}"
+    session.initialize(
+        candidate_cv=build_candidate_context(user, interview.position, job_description),
+        job_position=interview.position,
+        job_description=job_description
+    )
+
+
+def _load_pending(db: Session, interview_id: int):
+    interview = db.query(Interview).filter(
+        Interview.id == interview_id,
+        Interview.status == "pending"
+    ).first()
+    if interview is None or transcript_length(db, interview_id):
+        return None
+    return interview
+
+
+async def prepare_opening(interview_id: int):
+    """Generate the opening interviewer message ahead of POST /interview/start.
+
+    The message is stored as the first interview_messages row, so any
+    worker can serve it and rebuild the session from it. If the interview
+    was started in the meantime, start_interview's own opening wins and
+    this one is dropped.
+    """
+    db = SessionLocal()
+    try:
+        interview = _load_pending(db, interview_id)
+        if interview is None:
+            return
+        user = db.query(User).filter(User.id == interview.user_id).first()
+        session = InterviewSimulator()
+        initialize_for_interview(session, interview, user)
+    finally:
+        db.close()
+
+    try:
+        # Nobody is waiting on it yet, so live turns go first
+        result = await session.get_next_message_async(priority=Priority.ASSESSMENT)
+    except Exception as e:
+        print(f"[INTERVIEW] Opening preparation for {interview_id} failed: {e}")
+        return
+
+    db = SessionLocal()
+    try:
+        if _load_pending(db, interview_id) is None:
+            return
+        record_prepared_opening(db, interview_id, result)
+    except IntegrityError:
+        # start_interview recorded its own opening first
+        db.rollback()
+    finally:
+        db.close()
@@ -0,0 +1,105 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..models.interview_message import InterviewMessage
+from ..models.interview_answer_score import InterviewAnswerScore
+
+
+def transcript_length(db: Session, interview_id: int) -> int:
+    """Number of persisted turns, read from the (interview_id, seq) index"""
+    last = db.query(func.max(InterviewMessage.seq)).filter(
+        InterviewMessage.interview_id == interview_id
+    ).scalar()
+    return last or 0
+
+
+def record_turn(
+    db: Session,
+    interview_id: int,
+    candidate_message: Optional[str],
+    result: Dict[str, Any]
+) -> Optional[int]:
+    """Append the candidate answer (if any) and the interviewer reply for one turn.
+
+    Returns the seq of the candidate answer, or None when there was none.
+
+    Each turn is a small insert, so persistence cost does not grow with the
+    length of the interview. The (interview_id, seq) unique constraint
+    rejects a concurrent writer for the same turn.
+    """
+    seq = transcript_length(db, interview_id) + 1
+    answer_seq = None
+    rows = []
+    if candidate_message:
+        answer_seq = seq
+        rows.append(InterviewMessage(
+            interview_id=interview_id,
+            seq=seq,
+            role="user",
+            content=candidate_message
+        ))
+        seq += 1
+    rows.append(_interviewer_row(interview_id, seq, result))
+    db.add_all(rows)
+    db.commit()
+    return answer_seq
+
+
+def record_opening(db: Session, interview_id: int, result: Dict[str, Any]):
+    """Store the opening interviewer message as seq 1, replacing any earlier transcript.
+
+    Used when an interview is (re)started; a concurrent insert of seq 1 by
+    opening preparation is either deleted here or rejected by the unique
+    constraint.
+    """
+    clear_transcript(db, interview_id)
+    db.add(_interviewer_row(interview_id, 1, result))
+    db.commit()
+
+
+def record_prepared_opening(db: Session, interview_id: int, result: Dict[str, Any]):
+    """Insert a prepared opening as seq 1; raises IntegrityError if seq 1 already exists"""
+    db.add(_interviewer_row(interview_id, 1, result))
+    db.commit()
+
+
+def opening_message(db: Session, interview_id: int) -> Optional[str]:
+    """The prepared opening message, if it is the only persisted turn"""
+    rows = db.query(InterviewMessage.content).filter(
+        InterviewMessage.interview_id == interview_id
+    ).order_by(InterviewMessage.seq).limit(2).all()
+    return rows[0].content if len(rows) == 1 else None
+
+
+def _interviewer_row(interview_id: int, seq: int, result: Dict[str, Any]) -> InterviewMessage:
+    return InterviewMessage(
+        interview_id=interview_id,
+        seq=seq,
+        role="assistant",
+        content=result["message"],
+        prompt_tokens=result.get("prompt_tokens"),
+        completion_tokens=result.get("completion_tokens"),
+        latency_ms=result.get("latency_ms")
+    )
+
+
+def clear_transcript(db: Session, interview_id: int):
+    """Drop persisted turns and their answer scores (caller commits)"""
+    db.query(InterviewAnswerScore).filter(InterviewAnswerScore.interview_id == interview_id).delete()
+    db.query(InterviewMessage).filter(InterviewMessage.interview_id == interview_id).delete()
+
+
+def iter_transcript(db: Session, interview_id: int, batch_size: int = 100) -> Iterator[Dict[str, str]]:
+    """Yield {"role", "content"} in order, fetching rows in batches"""
+    rows = db.query(InterviewMessage.role, InterviewMessage.content).filter(
+        InterviewMessage.interview_id == interview_id
+    ).order_by(InterviewMessage.seq).yield_per(batch_size)
+    for role, content in rows:
+        yield {"role": role, "content": content}
+
+
+def load_conversation(db: Session, interview_id: int, legacy: Optional[List[Dict[str, str]]]) -> List[Dict[str, str]]:
+    """Transcript from interview_messages, falling back to Interview.conversation for older interviews"""
+    return list(iter_transcript(db, interview_id)) or legacy or []
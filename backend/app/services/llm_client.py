@@ -0,0 +1,65 @@
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI
+
+from ..core.config import settings
+
+NVIDIA_BASE_URL = "https://integrate.api.nvidia.com/v1"
+
+# One client (and so one keep-alive connection pool) per process, shared by
+# AIService and every InterviewSimulator, instead of a new pool and TLS
+# handshake per interview.
+_async_llm_client: Optional[AsyncOpenAI] = None
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _http_client_options() -> dict:
+    return {
+        "http2": _http2_available(),
+        "limits": httpx.Limits(
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY_SECONDS
+        ),
+        "timeout": httpx.Timeout(
+            settings.LLM_TIMEOUT_SECONDS,
+            connect=settings.LLM_CONNECT_TIMEOUT_SECONDS
+        )
+    }
+
+
+def get_async_llm_client() -> AsyncOpenAI:
+    global _async_llm_client
+    if _async_llm_client is None:
+        _async_llm_client = AsyncOpenAI(
+            base_url=NVIDIA_BASE_URL,
+            api_key=settings.NVIDIA_API_KEY,
+            http_client=httpx.AsyncClient(**_http_client_options()),
+            # Retries go through the LLM scheduler so they respect its rate limits
+            max_retries=0
+        )
+    return _async_llm_client
+
+
+async def warm_llm_clients():
+    """Open a pooled connection to the LLM endpoint so the first interview skips the handshake"""
+    client = get_async_llm_client()
+    try:
+        await client.models.list()
+    except Exception as e:
+        print(f"[LLM] Connection warm-up failed (continuing): {e}")
+
+
+async def close_llm_clients():
+    global _async_llm_client
+    if _async_llm_client is not None:
+        await _async_llm_client.close()
+        _async_llm_client = None
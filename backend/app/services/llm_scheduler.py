@@ -0,0 +1,284 @@
+import asyncio
+import heapq
+import itertools
+import random
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+import openai
+
+from ..core.config import settings
+from .conversation_context import estimate_messages_tokens
+
+
+class Priority(IntEnum):
+    """Scheduling classes, most urgent first"""
+    LIVE = 0  # interviewer turns a candidate is waiting on
+    ASSESSMENT = 1  # assessments, answer scoring, context summaries and prepared openings
+    CV_EXTRACTION = 2  # single CV uploads
+    BATCH = 3  # bulk CV imports
+
+
+# Worth retrying: rate limiting, server errors, timeouts and dropped connections
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError)
+
+
+class TokenBucket:
+    """Allowance refilled continuously at `per_minute`; a non-positive rate is unlimited"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` can be taken (requests larger than the bucket wait for a full one)"""
+        if self.capacity <= 0:
+            return 0.0
+        self._refill()
+        amount = min(amount, self.capacity)
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float):
+        if self.capacity > 0:
+            self.level -= min(amount, self.capacity)
+
+    def refund(self, amount: float):
+        if self.capacity > 0:
+            self.level = min(self.capacity, self.level + amount)
+
+    def drain(self):
+        if self.capacity > 0:
+            self._refill()
+            self.level = min(self.level, 0.0)
+
+
+class _ClassStats:
+    def __init__(self):
+        self.started = 0
+        self.retries = 0
+        self.failures = 0
+        self.waits: Deque[float] = deque(maxlen=1000)  # seconds queued, most recent calls
+
+    def snapshot(self, queued: int) -> Dict[str, Any]:
+        waits = sorted(self.waits)
+
+        def percentile(p: float) -> Optional[int]:
+            return int(waits[min(len(waits) - 1, int(p * len(waits)))] * 1000) if waits else None
+
+        return {
+            "queued": queued,
+            "started": self.started,
+            "retries": self.retries,
+            "failures": self.failures,
+            "wait_ms": {"p50": percentile(0.5), "p99": percentile(0.99), "max": percentile(1.0)}
+        }
+
+
+class LLMScheduler:
+    """Admission control for LLM calls made from the event loop.
+
+    Calls wait in a priority queue until a concurrency slot and enough
+    request and token budget are free; the most urgent class is always
+    admitted first. `live_reserved` slots are only ever given to LIVE calls,
+    so background work cannot occupy every slot while a candidate waits.
+    Token cost is estimated up front (prompt plus max_tokens) and the unused
+    part refunded from reported usage. Retryable failures are retried with
+    jittered exponential backoff, and a 429 drains the request budget so
+    other callers back off as well.
+
+    All limits are per process: with N workers the provider sees up to N
+    times the configured concurrency and rates.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_retries: int,
+        base_delay: float,
+        max_delay: float,
+        live_reserved: int = 0
+    ):
+        self.max_concurrency = max_concurrency
+        # Slots non-live classes may hold together; at least one so they still progress
+        self.background_limit = max(1, max_concurrency - live_reserved)
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        # (priority, arrival order, token cost, future)
+        self._waiters: List[Tuple[int, int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._in_flight = 0
+        self._background_in_flight = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._stats = {priority: _ClassStats() for priority in Priority}
+
+    async def _acquire(self, priority: Priority, tokens: int):
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), tokens, future))
+        enqueued = time.monotonic()
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Cancelled after being admitted: hand the slot back
+            if future.done() and not future.cancelled():
+                self._release(priority)
+            raise
+        stats = self._stats[priority]
+        stats.started += 1
+        stats.waits.append(time.monotonic() - enqueued)
+
+    def _release(self, priority: Priority):
+        self._in_flight -= 1
+        if priority != Priority.LIVE:
+            self._background_in_flight -= 1
+        self._dispatch()
+
+    def _dispatch(self):
+        while self._waiters and self._in_flight < self.max_concurrency:
+            priority, _, tokens, future = self._waiters[0]
+            if future.done():
+                # Caller gave up while queued
+                heapq.heappop(self._waiters)
+                continue
+
+            # The head is the most urgent waiter, so no LIVE call is queued behind it
+            background = priority != Priority.LIVE
+            if background and self._background_in_flight >= self.background_limit:
+                return
+
+            wait = max(self.requests.wait_time(1), self.tokens.wait_time(tokens))
+            if wait > 0:
+                self._wake_in(wait)
+                return
+
+            heapq.heappop(self._waiters)
+            self.requests.take(1)
+            self.tokens.take(tokens)
+            self._in_flight += 1
+            if background:
+                self._background_in_flight += 1
+            future.set_result(None)
+
+    def _wake_in(self, delay: float):
+        loop = asyncio.get_running_loop()
+        if self._timer is not None:
+            if self._timer.when() <= loop.time() + delay:
+                return
+            self._timer.cancel()
+        self._timer = loop.call_later(delay, self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self._dispatch()
+
+    def _settle(self, charged: int, usage: Any):
+        used = getattr(usage, "total_tokens", None)
+        if used is not None and used < charged:
+            self.tokens.refund(charged - used)
+
+    async def _backoff(self, priority: Priority, attempt: int, error: Exception):
+        self._stats[priority].retries += 1
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt) * random.uniform(0.5, 1.0)
+        if isinstance(error, openai.RateLimitError):
+            self.requests.drain()
+            retry_after = error.response.headers.get("retry-after")
+            try:
+                delay = max(delay, min(self.max_delay, float(retry_after)))
+            except (TypeError, ValueError):
+                pass
+        print(f"[LLM] {type(error).__name__} for {priority.name.lower()} call, retry {attempt + 1} in {delay:.1f}s")
+        await asyncio.sleep(delay)
+
+    async def _start(self, client: openai.AsyncOpenAI, priority: Priority, tokens: int, kwargs: Dict[str, Any]):
+        """Admit and send one request, retrying retryable failures; the caller releases the slot"""
+        attempt = 0
+        while True:
+            await self._acquire(priority, tokens)
+            try:
+                return await client.chat.completions.create(**kwargs)
+            except RETRYABLE_ERRORS as e:
+                self._release(priority)
+                if attempt >= self.max_retries:
+                    self._stats[priority].failures += 1
+                    raise
+                await self._backoff(priority, attempt, e)
+                attempt += 1
+            except BaseException:
+                self._release(priority)
+                raise
+
+    async def create(self, client: openai.AsyncOpenAI, priority: Priority, **kwargs) -> Any:
+        """client.chat.completions.create, scheduled and retried"""
+        tokens = estimate_messages_tokens(kwargs["messages"]) + kwargs.get("max_tokens", 0)
+        response = await self._start(client, priority, tokens, kwargs)
+        self._settle(tokens, getattr(response, "usage", None))
+        self._release(priority)
+        return response
+
+    async def stream(self, client: openai.AsyncOpenAI, priority: Priority, **kwargs) -> AsyncIterator[Any]:
+        """Streaming chat completion chunks; the slot is held until the stream ends.
+
+        Only opening the stream is retried, never a stream that has started.
+        """
+        tokens = estimate_messages_tokens(kwargs["messages"]) + kwargs.get("max_tokens", 0)
+        stream = await self._start(client, priority, tokens, {**kwargs, "stream": True})
+        usage = None
+        try:
+            async for chunk in stream:
+                usage = getattr(chunk, "usage", None) or usage
+                yield chunk
+        finally:
+            self._settle(tokens, usage)
+            self._release(priority)
+
+    def metrics(self) -> Dict[str, Any]:
+        queued = {priority: 0 for priority in Priority}
+        for priority, _, _, future in self._waiters:
+            if not future.done():
+                queued[Priority(priority)] += 1
+
+        return {
+            "in_flight": self._in_flight,
+            "max_concurrency": self.max_concurrency,
+            "background_in_flight": self._background_in_flight,
+            "background_limit": self.background_limit,
+            "requests_available": round(self.requests.level, 1) if self.requests.capacity > 0 else None,
+            "tokens_available": round(self.tokens.level) if self.tokens.capacity > 0 else None,
+            "classes": {
+                priority.name.lower(): self._stats[priority].snapshot(queued[priority])
+                for priority in Priority
+            }
+        }
+
+
+_llm_scheduler: Optional[LLMScheduler] = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    global _llm_scheduler
+    if _llm_scheduler is None:
+        _llm_scheduler = LLMScheduler(
+            max_concurrency=settings.LLM_MAX_CONCURRENT_REQUESTS,
+            requests_per_minute=settings.LLM_REQUESTS_PER_MINUTE,
+            tokens_per_minute=settings.LLM_TOKENS_PER_MINUTE,
+            max_retries=settings.LLM_MAX_RETRIES,
+            base_delay=settings.LLM_RETRY_BASE_DELAY_SECONDS,
+            max_delay=settings.LLM_RETRY_MAX_DELAY_SECONDS,
+            live_reserved=settings.LLM_LIVE_RESERVED_REQUESTS
+        )
+    return _llm_scheduler
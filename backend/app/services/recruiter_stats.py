@@ -0,0 +1,62 @@
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.interview import Interview
+
+HIGH_SCORE_THRESHOLD = 80
+
+# (counters, monotonic expiry); cleared whenever an interview is created,
+# changes status or gets scored in this process
+_stats_cache: Optional[Tuple[Dict[str, Any], float]] = None
+_stats_lock = threading.Lock()
+_stats_generation = 0
+
+
+def compute_recruiter_stats(db: Session) -> Dict[str, Any]:
+    """All dashboard counters in a single pass over interviews"""
+    total, completed, pending, high_scorers = db.query(
+        func.count(Interview.id),
+        func.count(Interview.id).filter(Interview.status == "completed"),
+        func.count(Interview.id).filter(Interview.status == "pending"),
+        func.count(Interview.id).filter(Interview.score >= HIGH_SCORE_THRESHOLD)
+    ).one()
+
+    return {
+        "total_interviews": total,
+        "completed_interviews": completed,
+        "pending_interviews": pending,
+        "high_scorers": high_scorers
+    }
+
+
+def get_recruiter_stats(db: Session) -> Dict[str, Any]:
+    """Cached dashboard counters, recomputed at most once per RECRUITER_STATS_TTL_SECONDS.
+
+    Other workers only see a change once their own copy expires, so the TTL
+    bounds how stale the dashboard can be.
+    """
+    global _stats_cache
+    with _stats_lock:
+        cached, generation = _stats_cache, _stats_generation
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    stats = compute_recruiter_stats(db)
+    with _stats_lock:
+        # Skip storing if an invalidation raced with the query
+        if generation == _stats_generation:
+            _stats_cache = (stats, time.monotonic() + settings.RECRUITER_STATS_TTL_SECONDS)
+    return stats
+
+
+def invalidate_recruiter_stats():
+    """Drop cached counters after an interview is created, changes status or is scored"""
+    global _stats_cache, _stats_generation
+    with _stats_lock:
+        _stats_cache = None
+        _stats_generation += 1
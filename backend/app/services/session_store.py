@@ -0,0 +1,199 @@
+import asyncio
+import json
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Any, Callable, Tuple
+
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.database import SessionLocal
+from ..models.interview_session import InterviewSessionState
+from .ai_service import InterviewSimulator
+
+
+class InterviewSessionStore:
+    """Interface for keeping interview sessions between candidate turns"""
+
+    def get(self, interview_id: int) -> Optional[InterviewSimulator]:
+        raise NotImplementedError
+
+    def save(self, interview_id: int, session: InterviewSimulator):
+        raise NotImplementedError
+
+    def delete(self, interview_id: int):
+        raise NotImplementedError
+
+    def sweep(self) -> int:
+        """Drop sessions idle for longer than the TTL and return how many were removed"""
+        return 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class InMemorySessionStore(InterviewSessionStore):
+    """Process-local store bounded by last-access TTL and LRU size.
+
+    Only safe with a single worker. Sessions abandoned by the candidate are
+    evicted; the routes rebuild them from the Interview row if needed.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # Ordered from least to most recently used
+        self._sessions: "OrderedDict[int, Tuple[InterviewSimulator, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted_ttl = 0
+        self.evicted_lru = 0
+
+    def _is_expired(self, last_access: float, now: float) -> bool:
+        return now - last_access > self.ttl_seconds
+
+    def get(self, interview_id: int) -> Optional[InterviewSimulator]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._sessions.get(interview_id)
+            if entry is None:
+                return None
+            session, last_access = entry
+            if self._is_expired(last_access, now):
+                del self._sessions[interview_id]
+                self.evicted_ttl += 1
+                return None
+            self._sessions[interview_id] = (session, now)
+            self._sessions.move_to_end(interview_id)
+            return session
+
+    def save(self, interview_id: int, session: InterviewSimulator):
+        with self._lock:
+            self._sessions[interview_id] = (session, time.monotonic())
+            self._sessions.move_to_end(interview_id)
+            while len(self._sessions) > self.max_entries:
+                self._sessions.popitem(last=False)
+                self.evicted_lru += 1
+
+    def delete(self, interview_id: int):
+        with self._lock:
+            self._sessions.pop(interview_id, None)
+
+    def sweep(self) -> int:
+        now = time.monotonic()
+        removed = 0
+        with self._lock:
+            # Oldest entries come first, so stop at the first live one
+            while self._sessions:
+                interview_id, (_, last_access) = next(iter(self._sessions.items()))
+                if not self._is_expired(last_access, now):
+                    break
+                del self._sessions[interview_id]
+                removed += 1
+            self.evicted_ttl += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "memory",
+            "sessions": len(self._sessions),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "evicted_ttl": self.evicted_ttl,
+            "evicted_lru": self.evicted_lru
+        }
+
+
+class DatabaseSessionStore(InterviewSessionStore):
+    """Stores sessions in the interview_sessions table so any worker can serve a turn"""
+
+    def __init__(self, ttl_seconds: int, session_factory: Callable[[], Session] = SessionLocal):
+        self.ttl_seconds = ttl_seconds
+        self._session_factory = session_factory
+        self.evicted_ttl = 0
+
+    @staticmethod
+    def _dump(state: Dict[str, Any]) -> bytes:
+        return zlib.compress(json.dumps(state, separators=(",", ":")).encode("utf-8"))
+
+    @staticmethod
+    def _load(blob: bytes) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+    def get(self, interview_id: int) -> Optional[InterviewSimulator]:
+        db = self._session_factory()
+        try:
+            row = db.query(InterviewSessionState).filter(
+                InterviewSessionState.interview_id == interview_id
+            ).first()
+            if row is None:
+                return None
+            return InterviewSimulator.from_state(self._load(row.state))
+        finally:
+            db.close()
+
+    def save(self, interview_id: int, session: InterviewSimulator):
+        db = self._session_factory()
+        try:
+            db.merge(InterviewSessionState(
+                interview_id=interview_id,
+                state=self._dump(session.to_state())
+            ))
+            db.commit()
+        finally:
+            db.close()
+
+    def delete(self, interview_id: int):
+        db = self._session_factory()
+        try:
+            db.query(InterviewSessionState).filter(
+                InterviewSessionState.interview_id == interview_id
+            ).delete()
+            db.commit()
+        finally:
+            db.close()
+
+    def sweep(self) -> int:
+        cutoff = datetime.utcnow() - timedelta(seconds=self.ttl_seconds)
+        db = self._session_factory()
+        try:
+            removed = db.query(InterviewSessionState).filter(
+                InterviewSessionState.updated_at < cutoff
+            ).delete()
+            db.commit()
+        finally:
+            db.close()
+        self.evicted_ttl += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": "database",
+            "ttl_seconds": self.ttl_seconds,
+            "evicted_ttl": self.evicted_ttl
+        }
+
+
+def create_session_store(backend: str) -> InterviewSessionStore:
+    if backend == "memory":
+        return InMemorySessionStore(
+            max_entries=settings.INTERVIEW_SESSION_MAX_ENTRIES,
+            ttl_seconds=settings.INTERVIEW_SESSION_TTL_SECONDS
+        )
+    if backend == "database":
+        return DatabaseSessionStore(ttl_seconds=settings.INTERVIEW_SESSION_TTL_SECONDS)
+    raise ValueError(f"Unknown interview session backend: {backend}")
+
+
+async def run_session_sweeper(store: InterviewSessionStore, interval_seconds: int):
+    """Periodically evict idle sessions until cancelled"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            removed = await asyncio.to_thread(store.sweep)
+            if removed:
+                print(f"[SESSIONS] Evicted {removed} idle interview session(s)")
+        except Exception as e:
+            print(f"[SESSIONS] Sweep failed: {e}")
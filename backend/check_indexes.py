@@ -0,0 +1,126 @@
+"""
+Index usage check (PostgreSQL only).
+Runs EXPLAIN for the hot dashboard and 2FA queries, first pages and
+cursor-bounded later pages, and confirms each one is served by the index
+added for it.
+
+Usage: python check_indexes.py
+
+Run it against a populated PostgreSQL database: planner statistics are
+refreshed first and sequential scans are disabled so small tables are not
+simply scanned. The SQLite dev database is not checked, since its planner
+makes different choices and keyset cursors there compare normalized
+datetimes that no index covers. Exits with status 1 if any index is not
+used and 2 when not connected to PostgreSQL.
+"""
+import sys
+import os
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from datetime import datetime
+
+from sqlalchemy import select, text, tuple_
+
+from app.core.database import engine, Base
+from app.models.user import User
+from app.models.interview import Interview
+from app.models.two_factor import TwoFactorSession
+
+PAGE = 51  # default page size plus the look-ahead row
+# Sort key of the last row of a previous page, as keyset_page filters on it
+CURSOR_CREATED_AT = (datetime(2026, 1, 1), 1000)
+CURSOR_SCORE = (70, 1000)
+
+LISTING_COLUMNS = (
+    Interview.id, Interview.user_id, Interview.position, Interview.company,
+    Interview.score, Interview.status, Interview.created_at, Interview.completed_at,
+    User.name, User.email
+)
+
+
+def page(statement, columns, cursor=None):
+    """A listing page as keyset_page issues it, optionally after a cursor"""
+    if cursor is not None:
+        statement = statement.where(tuple_(*columns) < tuple_(*cursor))
+    return statement.order_by(*[column.desc() for column in columns]).limit(PAGE)
+
+
+def listings(label, index_name, statement, columns, cursor):
+    return [
+        (label, index_name, page(statement, columns)),
+        (f"{label}, later page", index_name, page(statement, columns, cursor)),
+    ]
+
+
+RECRUITER_LISTING = select(*LISTING_COLUMNS).join(User, User.id == Interview.user_id)
+BY_CREATED_AT = (Interview.created_at, Interview.id)
+
+CHECKS = [
+    *listings(
+        "recruiter interviews",
+        "ix_interviews_created_at_id",
+        RECRUITER_LISTING, BY_CREATED_AT, CURSOR_CREATED_AT
+    ),
+    *listings(
+        "recruiter interviews by status",
+        "ix_interviews_status_created_at_id",
+        RECRUITER_LISTING.where(Interview.status == "in_progress"), BY_CREATED_AT, CURSOR_CREATED_AT
+    ),
+    *listings(
+        "scored candidates",
+        "ix_interviews_completed_score_id",
+        RECRUITER_LISTING.where(Interview.status == "completed", Interview.score > 0),
+        (Interview.score, Interview.id), CURSOR_SCORE
+    ),
+    *listings(
+        "candidate interviews",
+        "ix_interviews_user_created_at_id",
+        select(Interview.id, Interview.position, Interview.status, Interview.created_at)
+        .where(Interview.user_id == 1),
+        BY_CREATED_AT, CURSOR_CREATED_AT
+    ),
+    (
+        "interviews by cultural fit",
+        "ix_interviews_cultural_fit",
+        select(Interview.id).where(Interview.assessment["cultural_fit"].as_float() >= 8)
+    ),
+    (
+        "2FA sessions by user",
+        "ix_two_factor_sessions_user_id_expires_at",
+        select(TwoFactorSession.id).where(TwoFactorSession.user_id == 1)
+    ),
+]
+
+
+def explain(conn, statement) -> str:
+    sql = str(statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+    return "\n".join(" ".join(str(col) for col in row) for row in conn.execute(text("EXPLAIN " + sql)))
+
+
+def main() -> int:
+    if engine.dialect.name != "postgresql":
+        print(f"Index check requires PostgreSQL, DATABASE_URL points at {engine.dialect.name}")
+        return 2
+
+    Base.metadata.create_all(bind=engine)
+    failures = 0
+
+    with engine.connect() as conn:
+        conn.execute(text("ANALYZE"))
+        conn.execute(text("SET enable_seqscan = off"))
+
+        for label, index_name, statement in CHECKS:
+            plan = explain(conn, statement)
+            used = index_name in plan
+            print(f"[{'OK' if used else 'MISSING'}] {label}: {index_name}")
+            if not used:
+                failures += 1
+                print("    " + plan.replace("\n", "\n    "))
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+Bulk CV import script.
+Creates or updates candidate accounts from a directory or ZIP of CV files.
+
+Usage: python import_cvs.py PATH [--concurrency N] [--batch-size N] [--parse-workers N]
+
+Re-running with the same input resumes an interrupted import: files whose
+content was already imported are skipped.
+"""
+import argparse
+import asyncio
+import sys
+import os
+
+# Add the app directory to the path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.core.config import settings
+from app.core.database import engine, Base
+from app.services.cv_import import create_import_run, import_cvs, iter_cv_files
+from app.services.cv_parser import shutdown_parse_pool
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Bulk import candidate CVs")
+    parser.add_argument("path", help="Directory or ZIP archive of PDF/DOCX/TXT files")
+    parser.add_argument("--concurrency", type=int, default=settings.CV_IMPORT_CONCURRENCY,
+                        help="Maximum concurrent profile extractions")
+    parser.add_argument("--batch-size", type=int, default=settings.CV_IMPORT_BATCH_SIZE,
+                        help="Files written per database commit")
+    parser.add_argument("--parse-workers", type=int, default=settings.CV_PARSE_WORKERS,
+                        help="Document parsing processes")
+    return parser.parse_args()
+
+
+async def main(args):
+    run_id = create_import_run()
+    print(f"Starting import run {run_id} from {args.path}...")
+
+    try:
+        report = await import_cvs(
+            iter_cv_files(args.path),
+            run_id=run_id,
+            concurrency=args.concurrency,
+            batch_size=args.batch_size
+        )
+    finally:
+        shutdown_parse_pool()
+
+    for result in report.files:
+        line = f"  [{result['status'].upper():8}] {result['filename']}"
+        if result["error"]:
+            line += f" - {result['error']}"
+        print(line)
+
+    print(f"\nImported: {report.imported}, updated: {report.updated}, "
+          f"skipped: {report.skipped}, failed: {report.failed}")
+    print(f"Elapsed: {report.elapsed_seconds:.1f}s ({report.cvs_per_minute:.1f} CVs/min)")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    settings.CV_PARSE_WORKERS = args.parse_workers
+    Base.metadata.create_all(bind=engine)
+    asyncio.run(main(args))
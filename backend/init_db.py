@@ -15,7 +15,6 @@ from app.models.user import User, Role
 from app.models.interview import Interview
 from app.models.job import Job
 from app.models.two_factor import TwoFactorCode, TwoFactorSession
-import json
 
 
 def run_migrations():
@@ -66,7 +65,7 @@ def seed_data():
                 email="john.doe@email.com",
                 password=get_password_hash("password123"),
                 role=Role.CANDIDATE.value,
-                info=json.dumps({"skills": ["Python", "React", "SQL"], "experience_years": 3}),
+                info={"skills": ["Python", "React", "SQL"], "experience_years": 3},
                 cv="Experienced software developer with 3 years of experience..."
             ),
             User(
@@ -74,7 +73,7 @@ def seed_data():
                 email="jane.smith@email.com",
                 password=get_password_hash("password123"),
                 role=Role.CANDIDATE.value,
-                info=json.dumps({"skills": ["Java", "Spring", "AWS"], "experience_years": 5}),
+                info={"skills": ["Java", "Spring", "AWS"], "experience_years": 5},
                 cv="Senior backend developer specializing in Java..."
             ),
             User(
@@ -82,7 +81,7 @@ def seed_data():
                 email="mike.johnson@email.com",
                 password=get_password_hash("password123"),
                 role=Role.CANDIDATE.value,
-                info=json.dumps({"skills": ["JavaScript", "Node.js", "MongoDB"], "experience_years": 2}),
+                info={"skills": ["JavaScript", "Node.js", "MongoDB"], "experience_years": 2},
                 cv="Full-stack developer with passion for web technologies..."
             ),
             # Recruiters
@@ -91,14 +90,14 @@ def seed_data():
                 email="sarah@company.com",
                 password=get_password_hash("password123"),
                 role=Role.RECRUITER.value,
-                info=json.dumps({"company": "TechCorp", "department": "HR"})
+                info={"company": "TechCorp", "department": "HR"}
             ),
             User(
                 name="Tom Recruiter",
                 email="tom@company.com",
                 password=get_password_hash("password123"),
                 role=Role.RECRUITER.value,
-                info=json.dumps({"company": "StartupXYZ", "department": "Talent Acquisition"})
+                info={"company": "StartupXYZ", "department": "Talent Acquisition"}
             ),
         ]
 
@@ -145,8 +144,8 @@ def seed_data():
                 title="Senior Software Engineer",
                 department="Engineering",
                 description="Looking for an experienced software engineer to lead technical projects.",
-                required_skills=json.dumps(["Python", "AWS", "System Design"]),
-                preferred_skills=json.dumps(["Kubernetes", "Terraform"]),
+                required_skills=["Python", "AWS", "System Design"],
+                preferred_skills=["Kubernetes", "Terraform"],
                 min_experience_years=5,
                 salary_range="$150k-$200k",
                 work_mode="Hybrid"
@@ -155,8 +154,8 @@ def seed_data():
                 title="Full Stack Developer",
                 department="Product",
                 description="Join our product team to build amazing user experiences.",
-                required_skills=json.dumps(["React", "Node.js", "PostgreSQL"]),
-                preferred_skills=json.dumps(["TypeScript", "GraphQL"]),
+                required_skills=["React", "Node.js", "PostgreSQL"],
+                preferred_skills=["TypeScript", "GraphQL"],
                 min_experience_years=3,
                 salary_range="$100k-$140k",
                 work_mode="Remote"
@@ -0,0 +1,63 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Point the app at a throwaway SQLite database before anything imports it
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.database import Base, SessionLocal, engine
+from app.core.security import create_access_token, get_password_hash
+from app.models.user import User, Role
+
+
+@pytest.fixture(autouse=True)
+def fresh_database():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    # Not used as a context manager, so the lifespan (LLM warm-up, workers) does not run
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def password_hash():
+    # bcrypt is deliberately slow; hash once per run
+    return get_password_hash("password")
+
+
+@pytest.fixture
+def make_user(db, password_hash):
+    """Create a user and return (user, auth headers)"""
+    def make(email: str, role: str = Role.CANDIDATE.value, **fields):
+        user = User(
+            name=email.split("@")[0],
+            email=email,
+            password=password_hash,
+            role=role,
+            **fields
+        )
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        return user, {"Authorization": f"Bearer {create_access_token({'sub': email})}"}
+    return make
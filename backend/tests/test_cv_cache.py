@@ -0,0 +1,19 @@
+from app.core.config import settings
+from app.services.ai_service import CandidateProfile
+from app.services.cv_cache import CVCache
+
+
+def test_changing_extraction_budgets_misses_the_cache(monkeypatch):
+    cache = CVCache(max_entries=10, memory_entries=10)
+    profile = CandidateProfile(
+        name="Jane", email="jane@example.com", phone="", current_position="Engineer",
+        years_of_experience=5, skills=["Python"], education=[], work_history=[]
+    )
+    cache.put("a" * 64, "gpt-test", "1", "Jane Doe", profile)
+    assert cache.get("a" * 64, "gpt-test", "1") == ("Jane Doe", profile)
+
+    monkeypatch.setattr(settings, "CV_MAX_CHARS", settings.CV_MAX_CHARS * 2)
+    assert cache.get("a" * 64, "gpt-test", "1") is None
+
+    monkeypatch.setattr(settings, "CV_MAX_PAGES", settings.CV_MAX_PAGES + 1)
+    assert cache.get("a" * 64, "gpt-test", "1") is None
@@ -0,0 +1,112 @@
+import asyncio
+import io
+import threading
+import zipfile
+from datetime import datetime, timedelta
+
+from app.core.config import settings
+from app.models.cv_import import CVImportRun
+from app.models.user import Role
+from app.services import cv_import
+from app.services.ai_service import CandidateProfile
+from app.services.cv_import import INTERRUPTED_ERROR, create_import_run, fail_stale_import_runs, import_cvs, iter_cv_files
+
+
+def zip_bytes(members) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def test_oversized_members_are_failed_unread(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "CV_MAX_UPLOAD_BYTES", 1024)
+    path = tmp_path / "cvs.zip"
+    path.write_bytes(zip_bytes({"small.txt": b"a" * 100, "huge.txt": b"b" * 4096, "notes.md": b"c"}))
+
+    files = {name: (content, error) for name, content, error in iter_cv_files(str(path))}
+
+    assert files["small.txt"] == (b"a" * 100, None)
+    assert files["huge.txt"][0] == b""
+    assert "upload limit" in files["huge.txt"][1]
+    assert "notes.md" not in files
+
+
+def test_import_reads_files_off_the_event_loop_as_slots_free(monkeypatch):
+    loop_thread = threading.get_ident()
+    reader_threads, in_flight, peak = set(), [0], [0]
+
+    def files():
+        for i in range(6):
+            reader_threads.add(threading.get_ident())
+            # cv5 repeats cv0 and is skipped
+            yield f"cv{i}.txt", f"candidate {i % 5}".encode(), None
+
+    async def fake_process_cv(content, filename, content_sha256, priority):
+        in_flight[0] += 1
+        peak[0] = max(peak[0], in_flight[0])
+        await asyncio.sleep(0.01)
+        in_flight[0] -= 1
+        index = content.decode().split()[-1]
+        return content.decode(), CandidateProfile(
+            name=f"Candidate {index}", email=f"cv{index}@example.com", phone="", current_position="",
+            years_of_experience=1, skills=[], education=[], work_history=[]
+        )
+
+    monkeypatch.setattr(cv_import, "process_cv", fake_process_cv)
+    report = asyncio.run(import_cvs(files(), create_import_run(), concurrency=2, batch_size=2))
+
+    assert (report.imported, report.skipped, report.failed) == (5, 1, 0)
+    assert peak[0] == 2
+    assert loop_thread not in reader_threads
+
+
+def test_archive_over_the_cap_is_rejected(client, make_user, monkeypatch):
+    monkeypatch.setattr(settings, "CV_IMPORT_MAX_ARCHIVE_BYTES", 1024)
+    _, headers = make_user("recruiter@example.com", role=Role.RECRUITER.value)
+
+    archive = zip_bytes({f"cv{i}.txt": bytes(range(256)) * 8 for i in range(4)})
+    response = client.post(
+        "/api/recruiter/cv-import",
+        files={"file": ("cvs.zip", archive, "application/zip")},
+        headers=headers
+    )
+
+    assert response.status_code == 413
+    assert response.json()["detail"].startswith("Archive exceeds")
+
+
+def test_stale_running_imports_are_failed(db):
+    long_ago = datetime.utcnow() - timedelta(hours=2)
+    db.add_all([
+        CVImportRun(id="stale", status="running", started_at=long_ago, heartbeat_at=long_ago),
+        CVImportRun(id="legacy", status="running", started_at=long_ago),
+        CVImportRun(id="alive", status="running", started_at=long_ago, heartbeat_at=datetime.utcnow()),
+        CVImportRun(id="done", status="completed", started_at=long_ago)
+    ])
+    db.commit()
+
+    fail_stale_import_runs()
+
+    db.expire_all()
+    statuses = {run.id: (run.status, run.error) for run in db.query(CVImportRun)}
+    assert statuses == {
+        "stale": ("failed", INTERRUPTED_ERROR),
+        "legacy": ("failed", INTERRUPTED_ERROR),
+        "alive": ("running", None),
+        "done": ("completed", None)
+    }
+
+
+def test_polling_reports_a_stale_run_as_failed(client, db, make_user):
+    _, headers = make_user("recruiter@example.com", role=Role.RECRUITER.value)
+    long_ago = datetime.utcnow() - timedelta(hours=2)
+    db.add(CVImportRun(id="stale", status="running", started_at=long_ago, heartbeat_at=long_ago))
+    db.commit()
+
+    response = client.get("/api/recruiter/cv-import/stale", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "failed"
+    assert response.json()["error"] == INTERRUPTED_ERROR
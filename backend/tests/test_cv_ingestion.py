@@ -0,0 +1,88 @@
+import asyncio
+import os
+import tempfile
+from datetime import datetime, timedelta
+
+from app.models.cv_ingestion_job import CVIngestionJob
+from app.services.cv_ingestion import INTERRUPTED_ERROR, CVIngestionQueue
+from app.services.cv_parser import SpooledUpload
+
+
+def spooled_file() -> SpooledUpload:
+    fd, path = tempfile.mkstemp(suffix=".pdf")
+    os.close(fd)
+    return SpooledUpload(path=path, content_sha256="0" * 64, size=0)
+
+
+def test_heartbeat_keeps_own_jobs_and_fails_a_dead_workers(db, make_user):
+    candidate, _ = make_user("candidate@example.com")
+    stale = datetime.utcnow() - timedelta(minutes=5)
+    # A worker that crashed and restarted a minute ago left "orphan" behind
+    db.add_all([
+        CVIngestionJob(id="orphan", user_id=candidate.id, filename="a.pdf", status="processing", updated_at=stale),
+        CVIngestionJob(id="mine", user_id=candidate.id, filename="b.pdf", status="queued", updated_at=stale)
+    ])
+    db.commit()
+
+    queue = CVIngestionQueue(workers=0, max_pending=10)
+    queue._active.add("mine")
+    queue._heartbeat()
+
+    db.expire_all()
+    statuses = {job.id: job.status for job in db.query(CVIngestionJob)}
+    assert statuses == {"orphan": "failed", "mine": "queued"}
+
+
+def test_polling_reports_a_stale_job_as_failed(client, db, make_user):
+    candidate, headers = make_user("candidate@example.com")
+    db.add(CVIngestionJob(
+        id="orphan", user_id=candidate.id, filename="a.pdf", status="processing",
+        updated_at=datetime.utcnow() - timedelta(minutes=5)
+    ))
+    db.commit()
+
+    response = client.get("/api/interview/upload-cv/orphan", headers=headers)
+
+    assert response.status_code == 200
+    assert (response.json()["status"], response.json()["error"]) == ("failed", INTERRUPTED_ERROR)
+
+
+def test_start_fails_only_stale_jobs(db, make_user):
+    candidate, _ = make_user("candidate@example.com")
+    stale = datetime.utcnow() - timedelta(hours=2)
+    db.add_all([
+        CVIngestionJob(id="stale-queued", user_id=candidate.id, filename="a.pdf", status="queued", updated_at=stale),
+        CVIngestionJob(id="stale-processing", user_id=candidate.id, filename="b.pdf", status="processing", updated_at=stale),
+        CVIngestionJob(id="stale-completed", user_id=candidate.id, filename="c.pdf", status="completed", updated_at=stale),
+        CVIngestionJob(id="recent", user_id=candidate.id, filename="d.pdf", status="queued")
+    ])
+    db.commit()
+
+    CVIngestionQueue(workers=0, max_pending=10).fail_stale_jobs()
+
+    db.expire_all()
+    statuses = {job.id: (job.status, job.error) for job in db.query(CVIngestionJob)}
+    assert statuses == {
+        "stale-queued": ("failed", INTERRUPTED_ERROR),
+        "stale-processing": ("failed", INTERRUPTED_ERROR),
+        "stale-completed": ("completed", None),
+        "recent": ("queued", None)
+    }
+
+
+def test_stop_fails_queued_jobs_and_removes_their_files(db, make_user):
+    candidate, _ = make_user("candidate@example.com")
+    uploads = [spooled_file() for _ in range(3)]
+
+    async def submit_and_stop():
+        queue = CVIngestionQueue(workers=0, max_pending=10)
+        queue.start()
+        job_ids = [queue.submit(candidate.id, upload, "cv.pdf") for upload in uploads]
+        await queue.stop()
+        return job_ids
+
+    job_ids = asyncio.run(submit_and_stop())
+
+    assert not any(os.path.exists(upload.path) for upload in uploads)
+    jobs = db.query(CVIngestionJob).filter(CVIngestionJob.id.in_(job_ids)).all()
+    assert [job.status for job in jobs] == ["failed"] * 3
@@ -0,0 +1,56 @@
+import asyncio
+from concurrent.futures import Executor, Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.services import cv_parser
+
+
+class FakePool(Executor):
+    """Runs parses inline, or fails them as if the pool had been killed"""
+
+    def __init__(self, broken: bool):
+        self.broken = broken
+        self._processes = {}
+
+    def submit(self, fn, *args):
+        future = Future()
+        if self.broken:
+            future.set_exception(BrokenProcessPool("worker killed"))
+        else:
+            future.set_result(fn(*args))
+        return future
+
+
+@pytest.fixture
+def pools(monkeypatch):
+    created = []
+
+    def get_parse_pool():
+        if cv_parser._parse_pool is None:
+            # Only the first pool is broken, as after another parse timed out
+            cv_parser._parse_pool = FakePool(broken=not created)
+            created.append(cv_parser._parse_pool)
+        return cv_parser._parse_pool
+
+    monkeypatch.setattr(cv_parser, "_parse_pool", None)
+    monkeypatch.setattr(cv_parser, "_parse_slots", None)
+    monkeypatch.setattr(cv_parser, "get_parse_pool", get_parse_pool)
+    return created
+
+
+def test_parse_caught_in_a_broken_pool_is_retried_on_a_new_one(pools):
+    text = asyncio.run(cv_parser._run_in_pool("cv.txt", str.upper, "parsed"))
+
+    assert text == "PARSED"
+    assert len(pools) == 2
+
+
+def test_a_pool_replaced_meanwhile_is_not_shut_down(pools):
+    stale = FakePool(broken=True)
+    current = cv_parser.get_parse_pool()
+
+    cv_parser.shutdown_parse_pool(kill=True, pool=stale)
+
+    assert cv_parser._parse_pool is current
@@ -0,0 +1,51 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from app.models.interview import Interview
+from app.services import interview_assessment
+
+
+def assessing_interview(db, make_user, heartbeat_at):
+    candidate, _ = make_user("candidate@example.com")
+    interview = Interview(
+        user_id=candidate.id, position="Engineer", status="assessing",
+        assessment_heartbeat_at=heartbeat_at
+    )
+    db.add(interview)
+    db.commit()
+    return interview.id
+
+
+def test_assessment_held_by_a_live_worker_is_not_run_again(db, make_user, monkeypatch):
+    interview_id = assessing_interview(db, make_user, datetime.utcnow())
+    calls = []
+
+    async def generate(*args):
+        calls.append(args)
+        return {"overall_score": 80}
+
+    monkeypatch.setattr(interview_assessment, "_generate", generate)
+    asyncio.run(interview_assessment.run_assessment(interview_id))
+
+    assert calls == []
+    assert db.get(Interview, interview_id).status == "assessing"
+
+
+def test_stale_assessment_is_claimed_by_one_worker(db, make_user, monkeypatch):
+    interview_id = assessing_interview(db, make_user, datetime.utcnow() - timedelta(minutes=10))
+
+    assert interview_assessment._stale_assessments() == [interview_id]
+    assert interview_assessment._claim(interview_id) is True
+    assert interview_assessment._claim(interview_id) is False
+    assert interview_assessment._stale_assessments() == []
+
+    async def generate(*args):
+        return {"overall_score": 80}
+
+    monkeypatch.setattr(interview_assessment, "_generate", generate)
+    monkeypatch.setattr(interview_assessment, "_rebuild_session", lambda db, interview: None)
+    asyncio.run(interview_assessment.run_assessment(interview_id, claimed=True))
+
+    db.expire_all()
+    interview = db.get(Interview, interview_id)
+    assert (interview.status, interview.score, interview.assessment_heartbeat_at) == ("completed", 80, None)
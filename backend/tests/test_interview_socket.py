@@ -0,0 +1,15 @@
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.core.config import settings
+
+
+def test_socket_closes_when_auth_message_never_arrives(client, monkeypatch):
+    monkeypatch.setattr(settings, "INTERVIEW_WS_AUTH_TIMEOUT_SECONDS", 0.1)
+
+    with client.websocket_connect("/api/interview/ws/1") as websocket:
+        assert websocket.receive_json() == {"type": "error", "detail": "Authentication timed out"}
+        with pytest.raises(WebSocketDisconnect) as closed:
+            websocket.receive_text()
+
+    assert closed.value.code == 4401
@@ -0,0 +1,24 @@
+import asyncio
+
+from app.services.llm_scheduler import LLMScheduler, Priority
+
+
+def test_background_calls_leave_reserved_slots_to_live_turns():
+    async def scenario():
+        scheduler = LLMScheduler(
+            max_concurrency=3, requests_per_minute=0, tokens_per_minute=0,
+            max_retries=0, base_delay=0, max_delay=0, live_reserved=1
+        )
+        batch = [asyncio.create_task(scheduler._acquire(Priority.BATCH, 1)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert scheduler.metrics()["in_flight"] == 2
+        assert not batch[2].done()
+
+        # The reserved slot still admits a candidate's turn straight away
+        await asyncio.wait_for(scheduler._acquire(Priority.LIVE, 1), timeout=1)
+
+        scheduler._release(Priority.BATCH)
+        await asyncio.wait_for(batch[2], timeout=1)
+        assert scheduler.metrics()["background_in_flight"] == 2
+
+    asyncio.run(scenario())
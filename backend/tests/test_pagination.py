@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from app.api.pagination import NEXT_CURSOR_HEADER, encode_cursor
+from app.models.interview import Interview
+
+
+def walk(client, url, headers, limit):
+    """Ids of every page in order, following the next-page cursor"""
+    ids, cursor = [], None
+    for _ in range(100):
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        page = [item["id"] for item in response.json()]
+        assert len(page) <= limit
+        ids.extend(page)
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return ids
+    raise AssertionError(f"paging did not finish, saw {ids[:20]}")
+
+
+def test_cursor_walks_every_page_with_tied_timestamps(client, db, make_user):
+    candidate, headers = make_user("candidate@example.com")
+    # Rows stamped by the database default share a second and are stored
+    # without fractional seconds; explicit ones are stored with them
+    db.add_all([Interview(user_id=candidate.id, position=f"Engineer {i}") for i in range(5)])
+    db.commit()
+    stamped = db.query(Interview.created_at).first().created_at
+    db.add_all([
+        Interview(user_id=candidate.id, position="Explicit", created_at=stamped),
+        Interview(user_id=candidate.id, position="Explicit", created_at=stamped.replace(microsecond=500000)),
+        Interview(user_id=candidate.id, position="Older", created_at=datetime(2026, 1, 1))
+    ])
+    db.commit()
+
+    expected = [row.id for row in db.query(Interview.id)]
+    for limit in (1, 2, 3):
+        ids = walk(client, "/api/candidate/interviews", headers, limit)
+        assert sorted(ids) == sorted(expected)
+        assert len(ids) == len(set(ids))
+
+
+def test_cursor_with_wrong_value_types_is_rejected(client):
+    for values in ([5, 1], ["2026-01-01T00:00:00", "1"], [True, 1]):
+        response = client.get("/api/jobs", params={"cursor": encode_cursor(values)})
+        assert response.status_code == 400, values
+        assert response.json()["detail"] == "Invalid cursor"
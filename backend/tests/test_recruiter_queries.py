@@ -0,0 +1,55 @@
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+from app.core.database import engine
+from app.models.interview import Interview
+from app.models.user import Role
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def seed_interviews(db, make_user, first: int, count: int):
+    """Completed, scored interviews, each for a different candidate"""
+    start = datetime(2026, 1, 1)
+    for i in range(first, first + count):
+        candidate, _ = make_user(f"candidate{i}@example.com")
+        db.add(Interview(
+            user_id=candidate.id,
+            position=f"Engineer {i}",
+            status="completed",
+            score=50 + i % 50,
+            created_at=start + timedelta(minutes=i)
+        ))
+    db.commit()
+
+
+@pytest.mark.parametrize("url", ["/api/recruiter/interviews", "/api/recruiter/candidates"])
+def test_listing_query_count_does_not_grow_with_rows(client, db, make_user, url):
+    _, headers = make_user("recruiter@example.com", role=Role.RECRUITER.value)
+
+    counts = []
+    for first, count in ((0, 3), (3, 27)):
+        seed_interviews(db, make_user, first, count)
+        with count_queries() as statements:
+            response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        assert len(response.json()) == first + count
+        counts.append(len(statements))
+
+    # One listing query plus constant auth lookups, regardless of row count
+    assert counts[0] == counts[1]
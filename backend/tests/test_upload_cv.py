@@ -0,0 +1,25 @@
+import httpx
+import openai
+
+from app.api.routes import interview
+
+
+def test_rate_limited_extraction_returns_503(client, make_user, monkeypatch):
+    _, headers = make_user("candidate@example.com")
+
+    async def rate_limited(path, filename, content_sha256):
+        raise openai.RateLimitError(
+            "rate limited",
+            response=httpx.Response(429, request=httpx.Request("POST", "https://api.openai.com")),
+            body=None
+        )
+
+    monkeypatch.setattr(interview, "process_cv_file", rate_limited)
+    response = client.post(
+        "/api/interview/upload-cv",
+        files={"file": ("cv.txt", b"Jane Doe\njane@example.com", "text/plain")},
+        headers=headers
+    )
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
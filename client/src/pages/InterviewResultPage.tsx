@@ -19,7 +19,7 @@ interface InterviewResult {
   interview_id: number
   position: string
   company?: string
-  score: number
+  score: number | null
   status: string
   completed_at?: string
   conversation: { role: string; content: string }[]
@@ -55,6 +55,32 @@ const InterviewResultPage: React.FC = () => {
     }
   }, [id, loadResult])
 
+  const handleRetryAssessment = async () => {
+    if (!id) return
+
+    try {
+      await api.retryAssessment(parseInt(id))
+      setResult(prev => prev && { ...prev, status: 'assessing' })
+    } catch (err) {
+      setError(err instanceof Error ? err.message : 'Failed to retry assessment')
+    }
+  }
+
+  // The score is generated in the background after the last answer
+  useEffect(() => {
+    if (!id || result?.status !== 'assessing') return
+
+    const timer = setTimeout(async () => {
+      try {
+        const data = await api.getInterviewResult(parseInt(id))
+        setResult(data as unknown as InterviewResult)
+      } catch (err) {
+        setError(err instanceof Error ? err.message : 'Failed to load results')
+      }
+    }, 3000)
+    return () => clearTimeout(timer)
+  }, [id, result])
+
   if (isLoading) {
     return (
       <div className="min-h-screen bg-white flex items-center justify-center">
@@ -98,8 +124,27 @@ const InterviewResultPage: React.FC = () => {
 
       <main className="max-w-2xl mx-auto px-6 py-8">
         <div className="text-center mb-10">
-          <div className="text-5xl font-normal mb-1">{result.score}</div>
-          <p className="text-xs text-neutral-400 uppercase tracking-wide">Overall Score</p>
+          {result.status === 'assessing' ? (
+            <div className="flex flex-col items-center gap-3">
+              <div className="w-4 h-4 border-2 border-black border-t-transparent rounded-full animate-spin" />
+              <p className="text-sm text-neutral-500">Assessing your interview...</p>
+            </div>
+          ) : result.status === 'assessment_failed' ? (
+            <div className="flex flex-col items-center gap-3">
+              <p className="text-sm text-neutral-500">The assessment could not be generated.</p>
+              <button
+                onClick={handleRetryAssessment}
+                className="text-sm text-black underline hover:no-underline"
+              >
+                Try again
+              </button>
+            </div>
+          ) : (
+            <>
+              <div className="text-5xl font-normal mb-1">{result.score}</div>
+              <p className="text-xs text-neutral-400 uppercase tracking-wide">Overall Score</p>
+            </>
+          )}
           {result.assessment?.recommendation && (
             <p className="mt-3 text-sm text-neutral-600">
               {result.assessment.recommendation}
@@ -107,7 +152,7 @@ const InterviewResultPage: React.FC = () => {
           )}
         </div>
 
-        {result.assessment && (
+        {result.assessment?.overall_score !== undefined && (
           <div className="grid grid-cols-5 gap-3 mb-10 text-center">
             {[
               { label: 'Skills', value: result.assessment.skills_match },
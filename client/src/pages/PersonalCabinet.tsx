@@ -137,7 +137,7 @@ const PersonalCabinet: React.FC<PersonalCabinetProps> = ({ user_role }) => {
   }
 
   const handleViewInterview = (interview: Interview) => {
-    if (interview.status === 'completed') {
+    if (['completed', 'assessing', 'assessment_failed'].includes(interview.status)) {
       navigate(`/interview/${interview.id}/result`)
     } else if (interview.status === 'pending' || interview.status === 'in_progress') {
       navigate(`/interview/${interview.id}`)
@@ -278,11 +278,17 @@ const PersonalCabinet: React.FC<PersonalCabinetProps> = ({ user_role }) => {
                       <span className={`text-xs px-2 py-0.5 ${
                         interview.status === 'completed'
                           ? 'bg-black text-white'
-                          : interview.status === 'in_progress'
+                          : interview.status === 'in_progress' || interview.status === 'assessing'
                           ? 'bg-neutral-200 text-neutral-600'
                           : 'border border-neutral-300 text-neutral-500'
                       }`}>
-                        {interview.status === 'in_progress' ? 'In Progress' : interview.status}
+                        {interview.status === 'in_progress'
+                          ? 'In Progress'
+                          : interview.status === 'assessing'
+                          ? 'Assessing'
+                          : interview.status === 'assessment_failed'
+                          ? 'Assessment Failed'
+                          : interview.status}
                       </span>
                     </td>
                     <td className="px-4 py-3 text-sm">
@@ -305,7 +311,7 @@ const PersonalCabinet: React.FC<PersonalCabinetProps> = ({ user_role }) => {
                         onClick={() => handleViewInterview(interview)}
                         className="text-xs text-neutral-500 hover:text-black underline"
                       >
-                        {interview.status === 'completed' ? 'View' : interview.status === 'in_progress' ? 'Continue' : 'Start'}
+                        {['completed', 'assessing', 'assessment_failed'].includes(interview.status) ? 'View' : interview.status === 'in_progress' ? 'Continue' : 'Start'}
                       </button>
                     </td>
                   </tr>
@@ -171,6 +171,12 @@ class ApiService {
     return this.request<InterviewDetail>(`/interview/result/${interviewId}`);
   }
 
+  async retryAssessment(interviewId: number): Promise<{ interview_id: number; status: string }> {
+    return this.request(`/interview/result/${interviewId}/retry`, {
+      method: 'POST',
+    });
+  }
+
   async uploadCV(file: File): Promise<{ message: string; profile: Partial<User> }> {
     const formData = new FormData();
     formData.append('file', file);
@@ -3,7 +3,7 @@ export interface User {
   name: string;
   email: string;
   role: 'ROLE_CANDIDATE' | 'ROLE_RECRUITER';
-  info?: string;
+  info?: Record<string, unknown>;
   cv?: string;
   two_factor_enabled?: boolean;
   totp_confirmed?: boolean;
@@ -77,7 +77,7 @@ export interface Interview {
   position: string;
   company?: string;
   score: number;
-  status: 'pending' | 'in_progress' | 'completed';
+  status: 'pending' | 'in_progress' | 'assessing' | 'assessment_failed' | 'completed';
   created_at?: string;
   completed_at?: string;
   candidate_name?: string;